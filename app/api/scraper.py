@@ -1,6 +1,8 @@
+import asyncio
 import logging
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from fastapi import APIRouter, Body, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.models.scraper import (
     ScrapeSingleUrlRequest,
@@ -19,12 +21,47 @@ from app.core.serper_service import SerperService
 logger = logging.getLogger(__name__)
 
 router = APIRouter(
-    responses={400: {"description": "Bad request"}, 500: {"description": "Scraping failed"}}
+    responses={400: {"description": "Bad request"}, 500: {"description": "Scraping failed"}},
+    # Scraper payloads carry large Markdown bodies; orjson serializes them
+    # several times faster than the stdlib encoder
+    default_response_class=ORJSONResponse,
 )
 scraper_service = ScraperService()
 documents_service = DocumentsService()
 serper_service = SerperService()
 
+# Bound on concurrent document writes fanned out per request
+DOC_WRITE_CONCURRENCY = 16
+
+
+async def _store_documents(results: List[Dict[str, Any]], tags: Optional[List[str]]) -> List[Any]:
+    """
+    Create documents for scraped results in parallel with bounded concurrency.
+
+    create_document is synchronous, so each write runs in the default
+    executor instead of blocking the event loop. Returns a list aligned
+    with `results` where each entry is the created document or the
+    exception raised for it.
+    """
+    semaphore = asyncio.Semaphore(DOC_WRITE_CONCURRENCY)
+    loop = asyncio.get_running_loop()
+
+    async def store_one(result: Dict[str, Any]):
+        async with semaphore:
+            return await loop.run_in_executor(
+                None,
+                lambda: documents_service.create_document(
+                    title=result["title"],
+                    content=result["content"],
+                    document_type=DocumentType.WEBPAGE,
+                    metadata=result["metadata"],
+                    tags=tags or [],
+                    source_url=result["url"],
+                ),
+            )
+
+    return await asyncio.gather(*(store_one(r) for r in results), return_exceptions=True)
+
 
 @router.post(
     "/url",
@@ -70,22 +107,15 @@ async def scrape_multiple_urls(request: UrlList = Body(...)):
     """
     try:
         results = await scraper_service.scrape_urls(request.urls)
-        # If requested, store results as documents
+        # If requested, store results as documents in parallel
         if request.store_as_documents:
-            for i, result in enumerate(results):
-                if result["success"]:
-                    try:
-                        doc = documents_service.create_document(
-                            title=result["title"],
-                            content=result["content"],
-                            document_type=DocumentType.WEBPAGE,
-                            metadata=result["metadata"],
-                            tags=request.document_tags or [],
-                            source_url=result["url"],
-                        )
-                        results[i]["document_id"] = doc["id"]
-                    except Exception as e:
-                        results[i]["error"] = f"Document creation failed: {str(e)}"
+            successful = [result for result in results if result["success"]]
+            docs = await _store_documents(successful, request.document_tags)
+            for result, doc in zip(successful, docs):
+                if isinstance(doc, Exception):
+                    result["error"] = f"Document creation failed: {str(doc)}"
+                else:
+                    result["document_id"] = doc["id"]
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Scraping failed: {str(e)}") from e
@@ -121,23 +151,18 @@ async def crawl_website(request: ScrapeCrawlRequest = Body(...)):
         if "verification_results" in results:
             response["verification_results"] = results["verification_results"]
             response["verification_success_rate"] = results["verification_success_rate"]
-        # If requested, create documents
+        # If requested, create documents in parallel
         if request.create_documents:
+            successful = [
+                result for result in results.get("results", []) if result.get("success", False)
+            ]
+            docs = await _store_documents(successful, request.document_tags)
             document_ids = []
-            for result in results.get("results", []):
-                if result.get("success", False):
-                    try:
-                        doc = documents_service.create_document(
-                            title=result["title"],
-                            content=result["content"],
-                            document_type=DocumentType.WEBPAGE,
-                            metadata=result["metadata"],
-                            tags=request.document_tags or [],
-                            source_url=result["url"],
-                        )
-                        document_ids.append(doc["id"])
-                    except Exception:
-                        pass
+            for doc in docs:
+                if isinstance(doc, Exception):
+                    logger.error(f"Error creating document: {str(doc)}")
+                else:
+                    document_ids.append(doc["id"])
             response["documents_created"] = len(document_ids)
             response["document_ids"] = document_ids
         return response
@@ -159,22 +184,15 @@ async def search_and_scrape(request: SearchAndScrapeRequest = Body(...)):
     """
     try:
         results = await scraper_service.search_and_scrape(request.query, request.max_results)
-        # If requested, create documents
+        # If requested, create documents in parallel
         if request.create_documents:
-            for i, result in enumerate(results):
-                if result.get("success", False):
-                    try:
-                        doc = documents_service.create_document(
-                            title=result["title"],
-                            content=result["content"],
-                            document_type=DocumentType.WEBPAGE,
-                            metadata=result["metadata"],
-                            tags=request.document_tags or [],
-                            source_url=result["url"],
-                        )
-                        results[i]["document_id"] = doc["id"]
-                    except Exception:
-                        pass
+            successful = [result for result in results if result.get("success", False)]
+            docs = await _store_documents(successful, request.document_tags)
+            for result, doc in zip(successful, docs):
+                if isinstance(doc, Exception):
+                    logger.error(f"Error creating document: {str(doc)}")
+                else:
+                    result["document_id"] = doc["id"]
         return results
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Search and scrape failed: {str(e)}") from e
@@ -224,27 +242,22 @@ async def enhanced_search(request: SerperSearchRequest = Body(...)):
             locale=request.locale
         )
         
-        # If requested, create documents from scraped content
+        # If requested, create documents from scraped content in parallel
         if request.create_documents and request.auto_scrape and results.get("scraped_content"):
+            successful = [
+                result for result in results["scraped_content"] if result.get("success", False)
+            ]
+            docs = await _store_documents(successful, request.document_tags)
             document_ids = []
-            for i, result in enumerate(results["scraped_content"]):
-                if result.get("success", False):
-                    try:
-                        doc = documents_service.create_document(
-                            title=result["title"],
-                            content=result["content"],
-                            document_type=DocumentType.WEBPAGE,
-                            metadata=result["metadata"],
-                            tags=request.document_tags or [],
-                            source_url=result["url"],
-                        )
-                        results["scraped_content"][i]["document_id"] = doc["id"]
-                        document_ids.append(doc["id"])
-                    except Exception as e:
-                        logger.error(f"Error creating document: {str(e)}")
-            
+            for result, doc in zip(successful, docs):
+                if isinstance(doc, Exception):
+                    logger.error(f"Error creating document: {str(doc)}")
+                else:
+                    result["document_id"] = doc["id"]
+                    document_ids.append(doc["id"])
+
             results["document_ids"] = document_ids
-        
+
         return results
     except Exception as e:
         logger.error(f"Enhanced search failed: {str(e)}", exc_info=True)
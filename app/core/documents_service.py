@@ -90,6 +90,10 @@ class DocumentsService:
 
         self.index_lock = threading.Lock()
         self.file_locks = {}
+        # Held across each stage+commit pair: GitService locks individual
+        # calls, so without this a concurrent writer's staged file gets
+        # swept into another thread's commit
+        self.git_write_lock = threading.Lock()
 
     def _get_file_lock(self, doc_id):
         """Get a lock for a specific file to prevent concurrent modifications"""
@@ -151,8 +155,9 @@ class DocumentsService:
         )
 
         rel_path = doc_path.relative_to(self.base_path)
-        self.git_service.add_files(self.repo_path, [str(rel_path)])
-        self.git_service.commit_changes(self.repo_path, f"Created document: {title}")
+        with self.git_write_lock:
+            self.git_service.add_files(self.repo_path, [str(rel_path)])
+            self.git_service.commit_changes(self.repo_path, f"Created document: {title}")
 
         self._update_memory_graph(doc_id, title, document_type.value, tags, metadata, source_url)
 
@@ -256,8 +261,9 @@ class DocumentsService:
                 self._update_index(doc_id, doc_info_update)
 
             rel_path = doc_path.relative_to(self.base_path)
-            self.git_service.add_files(self.repo_path, [str(rel_path)])
-            self.git_service.commit_changes(self.repo_path, commit_message)
+            with self.git_write_lock:
+                self.git_service.add_files(self.repo_path, [str(rel_path)])
+                self.git_service.commit_changes(self.repo_path, commit_message)
 
             self._update_memory_graph(
                 doc_id,
@@ -384,10 +390,11 @@ class DocumentsService:
             doc_path.unlink()
 
             rel_path = doc_path.relative_to(self.base_path)
-            self.git_service.remove_file(self.repo_path, str(rel_path))
-            self.git_service.commit_changes(
-                self.repo_path, f"Deleted document: {doc_info.get('title', doc_id)}"
-            )
+            with self.git_write_lock:
+                self.git_service.remove_file(self.repo_path, str(rel_path))
+                self.git_service.commit_changes(
+                    self.repo_path, f"Deleted document: {doc_info.get('title', doc_id)}"
+                )
 
             self._remove_index(doc_id)
 
@@ -5,9 +5,9 @@ import hashlib
 from typing import Optional, List, Dict, Any
 import time
 import threading
-import glob
 import shutil
 import fnmatch
+import re
 from app.utils.config import get_config
 
 # Third-party imports in try/except for graceful handling
@@ -214,15 +214,35 @@ class FilesystemService:
             raise ValueError(f"Unsupported storage type: {storage}")
 
     def search_files(self, directory: str, pattern: str, storage: str = "local", bucket: Optional[str] = None) -> List[str]:
+        # Compile the glob once up front; matching entry names against a
+        # compiled regex skips the per-call normcase + cache lookup that
+        # fnmatch.fnmatch does for every file
+        pattern_re = re.compile(fnmatch.translate(pattern))
         if storage == "local":
             dir_path = self.normalize_path(directory)
             if not dir_path.exists() or not dir_path.is_dir():
                 raise ValueError(f"Directory does not exist: {directory}")
             
             matches = []
-            for root, _, _ in os.walk(dir_path):
-                for file in glob.glob(os.path.join(root, pattern)):
-                    matches.append(file)
+
+            # scandir yields DirEntry objects whose type comes from the
+            # dirent record, so the walk never stats entries the way the
+            # old os.walk + glob pass did. An explicit stack avoids
+            # recursion limits on deep trees, and unreadable directories
+            # are skipped the way os.walk's default onerror did.
+            stack = [str(dir_path)]
+            while stack:
+                path = stack.pop()
+                try:
+                    entries = os.scandir(path)
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif pattern_re.match(entry.name):
+                            matches.append(entry.path)
             return matches
         elif storage == "s3":
             if not bucket:
@@ -238,7 +258,7 @@ class FilesystemService:
             if 'Contents' in response:
                 for obj in response['Contents']:
                     key = obj['Key']
-                    if fnmatch.fnmatch(os.path.basename(key), pattern):
+                    if pattern_re.match(os.path.basename(key)):
                         matches.append(key)
             return matches
         else:
@@ -1,3 +1,4 @@
+import io
 import json
 import os
 import threading
@@ -17,19 +18,28 @@ logger = logging.getLogger(__name__)
 class MemoryService:
     def __init__(self, memory_file_path: Optional[str] = None):
         config = get_config()
-        
+
         memory_file_path = memory_file_path or config.memory_file_path
-        self.memory_file_path = Path(
-            memory_file_path
-            if Path(memory_file_path).is_absolute()
-            else Path(os.getcwd()) / memory_file_path
-        )
-        
-        self.memory_file_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        self.user_prefs_dir = self.memory_file_path.parent / "user_preferences"
-        self.user_prefs_dir.mkdir(exist_ok=True)
-        
+        # ":memory:" keeps the graph and user preferences in process-local
+        # buffers instead of files — useful for tests and ephemeral use
+        self.in_memory = memory_file_path == ":memory:"
+        if self.in_memory:
+            self.memory_file_path = Path(memory_file_path)
+            self.user_prefs_dir = None
+            self._memory_buffer: Optional[str] = None
+            self._prefs_buffer: Dict[str, Dict[str, Any]] = {}
+        else:
+            self.memory_file_path = Path(
+                memory_file_path
+                if Path(memory_file_path).is_absolute()
+                else Path(os.getcwd()) / memory_file_path
+            )
+
+            self.memory_file_path.parent.mkdir(parents=True, exist_ok=True)
+
+            self.user_prefs_dir = self.memory_file_path.parent / "user_preferences"
+            self.user_prefs_dir.mkdir(exist_ok=True)
+
         self.use_graph_db = config.use_graph_db
         if self.use_graph_db:
             try:
@@ -46,12 +56,22 @@ class MemoryService:
         # Load existing data if available
         self._load_memory()
 
+    def _open_memory_file(self, mode: str = "r"):
+        """Open the backing store for reading: a StringIO over the buffer
+        in ':memory:' mode, the real file otherwise"""
+        if self.in_memory:
+            return io.StringIO(self._memory_buffer or "")
+        return open(self.memory_file_path, mode, encoding="utf-8")
+
     def _read_graph_file(self) -> KnowledgeGraph:
-        """Read the knowledge graph from disk"""
-        if not self.memory_file_path.exists():
+        """Read the knowledge graph from disk (or the in-memory buffer)"""
+        if self.in_memory:
+            if self._memory_buffer is None:
+                return KnowledgeGraph(entities=[], relations=[])
+        elif not self.memory_file_path.exists():
             return KnowledgeGraph(entities=[], relations=[])
         try:
-            with open(self.memory_file_path, "r", encoding="utf-8") as f:
+            with self._open_memory_file("r") as f:
                 lines = [line for line in f if line.strip()]
                 entities = []
                 relations = []
@@ -85,9 +105,12 @@ class MemoryService:
             relation_dict = r.dict(by_alias=True)
             relation_dict["type"] = "relation"
             lines.append(json.dumps(relation_dict))
-        # Write to file
-        with open(self.memory_file_path, "w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
+        # Write to the backing store
+        if self.in_memory:
+            self._memory_buffer = "\n".join(lines)
+        else:
+            with open(self.memory_file_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(lines))
 
     def create_entities(self, entities: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """Create new entities in the graph"""
@@ -381,6 +404,8 @@ class MemoryService:
     def get_user_preference(self, user_id: str) -> Dict[str, Any]:
         """Retrieve user preferences"""
         try:
+            if self.in_memory:
+                return dict(self._prefs_buffer.get(user_id, {}))
             pref_file = self.user_prefs_dir / f"{user_id}.json"
             if not pref_file.exists():
                 logger.debug("No preferences found for user %s", user_id)
@@ -398,6 +423,12 @@ class MemoryService:
             if not user_id or '/' in user_id or '\\' in user_id or '..' in user_id:
                 logger.error("Invalid user ID: %s", user_id)
                 raise ValueError("Invalid user ID")
+            if self.in_memory:
+                existing_prefs = dict(self._prefs_buffer.get(user_id, {}))
+                existing_prefs.update(preferences)
+                self._prefs_buffer[user_id] = existing_prefs
+                logger.info("Updated preferences for user %s", user_id)
+                return existing_prefs
             pref_file = self.user_prefs_dir / f"{user_id}.json"
             # Merge with existing preferences if present
             existing_prefs = {}
@@ -651,9 +682,13 @@ class MemoryService:
 
     def _load_memory(self):
         """Load memory data from file"""
-        if os.path.exists(self.memory_file_path):
+        if self.in_memory:
+            has_data = self._memory_buffer is not None
+        else:
+            has_data = os.path.exists(self.memory_file_path)
+        if has_data:
             try:
-                with open(self.memory_file_path, 'r', encoding='utf-8') as f:
+                with self._open_memory_file('r') as f:
                     data = json.load(f)
                     self.entities = data.get('entities', {})
                     self.relations = data.get('relations', [])
@@ -672,11 +707,15 @@ class MemoryService:
     def _save_memory(self):
         """Save memory data to file"""
         try:
-            with open(self.memory_file_path, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'entities': self.entities,
-                    'relations': self.relations
-                }, f, indent=2)
+            data = json.dumps({
+                'entities': self.entities,
+                'relations': self.relations
+            }, indent=2)
+            if self.in_memory:
+                self._memory_buffer = data
+            else:
+                with open(self.memory_file_path, 'w', encoding='utf-8') as f:
+                    f.write(data)
             logger.info(f"Saved {len(self.entities)} entities and {len(self.relations)} relations to {self.memory_file_path}")
         except Exception as e:
             logger.error(f"Error saving memory data: {e}")
@@ -266,6 +266,37 @@ class ScraperService:
         # Remove duplicates and return
         return list(set(links))
 
+    # Bound on concurrently in-flight scrapes when fanning out over
+    # search results
+    SCRAPE_CONCURRENCY = 8
+
+    async def _scrape_concurrently(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Scrape URLs concurrently instead of one at a time.
+
+        Each task keeps the politeness jitter before its request and the
+        semaphore caps in-flight scrapes; results come back in input
+        order with exceptions converted to error dicts.
+        """
+        semaphore = asyncio.Semaphore(self.SCRAPE_CONCURRENCY)
+
+        async def scrape_one(url: str) -> Dict[str, Any]:
+            async with semaphore:
+                await asyncio.sleep(random.uniform(self.min_delay, self.max_delay))
+                return await self.get_or_scrape_url(url)
+
+        results = await asyncio.gather(
+            *(scrape_one(url) for url in urls), return_exceptions=True
+        )
+        cleaned = []
+        for url, result in zip(urls, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Error scraping URL {url}: {str(result)}")
+                cleaned.append({"url": url, "success": False, "error": str(result)})
+            else:
+                cleaned.append(result)
+        return cleaned
+
     async def search_and_scrape(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
         Search for a query and scrape the top results.
@@ -285,36 +316,13 @@ class ScraperService:
                 logger.warning(f"No URLs found for search query: {query}")
                 return [{"query": query, "success": False, "error": "No search results found"}]
             
-            # Scrape each URL
-            results = []
-            for url in urls:
-                try:
-                    # Add a small delay between requests
-                    await asyncio.sleep(random.uniform(self.min_delay, self.max_delay))
-                    
-                    # Scrape the URL
-                    result = await self.get_or_scrape_url(url)
-                    result["query"] = query  # Add the original query to the result
-                    
-                    # Clean up the result
-                    if not result.get("success", False):
-                        logger.warning(f"Failed to scrape URL: {url}")
-                    
-                    results.append(result)
-                    
-                    # Limit the number of results
-                    if len(results) >= max_results:
-                        break
-                        
-                except Exception as e:
-                    logger.error(f"Error scraping URL {url}: {str(e)}")
-                    results.append({
-                        "url": url,
-                        "query": query,
-                        "success": False,
-                        "error": str(e)
-                    })
-            
+            # Scrape the URLs concurrently
+            results = await self._scrape_concurrently(urls[:max_results])
+            for result in results:
+                result["query"] = query  # Add the original query to the result
+                if not result.get("success", False):
+                    logger.warning(f"Failed to scrape URL: {result.get('url')}")
+
             return results
             
         except Exception as e:
@@ -370,26 +378,13 @@ class ScraperService:
                 if "link" in result and len(urls_to_scrape) < max_scrape:
                     urls_to_scrape.append(result["link"])
             
-            # Scrape each URL
-            scraped_content = []
-            for url in urls_to_scrape:
-                try:
-                    # Add a small delay between requests
-                    await asyncio.sleep(random.uniform(self.min_delay, self.max_delay))
-                    
-                    # Scrape the URL
-                    result = await self.get_or_scrape_url(url)
-                    
-                    if result.get("success", False):
-                        scraped_content.append(result)
-                    
-                except Exception as e:
-                    logger.error(f"Error scraping URL {url}: {str(e)}")
-                    scraped_content.append({
-                        "url": url,
-                        "success": False,
-                        "error": str(e)
-                    })
+            # Scrape the URLs concurrently; keep successes and hard
+            # failures, dropping clean-but-unsuccessful scrapes as before
+            scraped = await self._scrape_concurrently(urls_to_scrape)
+            scraped_content = [
+                result for result in scraped
+                if result.get("success", False) or "error" in result
+            ]
             
             return {
                 "query": query,
@@ -556,27 +551,112 @@ class ScraperService:
                 "error": str(e)
             }
 
+    # Number of crawl worker coroutines and per-host concurrency cap
+    CRAWL_WORKERS = 16
+    CRAWL_PER_HOST = 2
+
     async def crawl_website(self, start_url: str, max_pages: int = 50,
                         recursion_depth: int = 2, allowed_domains: Optional[List[str]] = None,
                         verification_pass: bool = False) -> Dict[str, Any]:
         """
         Crawl a website starting from a URL.
-        
-        This enhanced version uses the Serper service for more context when appropriate.
-        
+
+        Uses an async producer-consumer queue with a pool of worker
+        coroutines instead of per-depth recursion, so one slow page never
+        stalls the rest of its depth level. Per-host semaphores keep a
+        single slow host from starving the workers.
+
         Args:
             start_url: URL to start crawling from
             max_pages: Maximum number of pages to crawl
             recursion_depth: Maximum recursion depth
             allowed_domains: List of domains to restrict crawling to
             verification_pass: Whether to do a verification pass to check content stability
-            
+
         Returns:
             Dictionary with crawling results
         """
-        # Use existing code but with Serper enhancements when appropriate
-        # ...implementation would remain largely the same...
-        pass
+        try:
+            queue: "asyncio.Queue" = asyncio.Queue()
+            queue.put_nowait((start_url, 0))
+            seen = {start_url}
+            results: List[Dict[str, Any]] = []
+            host_semaphores: Dict[str, asyncio.Semaphore] = {}
+            allowed = set(allowed_domains) if allowed_domains else {urlparse(start_url).netloc}
+
+            async def worker():
+                while True:
+                    url, depth = await queue.get()
+                    try:
+                        if len(results) >= max_pages:
+                            continue
+                        host = urlparse(url).netloc
+                        semaphore = host_semaphores.setdefault(
+                            host, asyncio.Semaphore(self.CRAWL_PER_HOST)
+                        )
+                        async with semaphore:
+                            result = await self.get_or_scrape_url(url)
+                        results.append(result)
+                        if result.get("success", False) and depth < recursion_depth:
+                            for link in result.get("links", []):
+                                parsed = urlparse(link)
+                                if parsed.scheme not in ("http", "https"):
+                                    continue
+                                if parsed.netloc not in allowed:
+                                    continue
+                                if link in seen or len(seen) >= max_pages:
+                                    continue
+                                seen.add(link)
+                                queue.put_nowait((link, depth + 1))
+                    except Exception as e:
+                        logger.warning(f"Error crawling {url}: {e}")
+                        results.append({"url": url, "success": False, "error": str(e)})
+                    finally:
+                        queue.task_done()
+
+            workers = [asyncio.create_task(worker()) for _ in range(self.CRAWL_WORKERS)]
+            try:
+                await queue.join()
+            finally:
+                for task in workers:
+                    task.cancel()
+
+            success_count = sum(1 for r in results if r.get("success", False))
+            response = {
+                "start_url": start_url,
+                "pages_crawled": len(results),
+                "success_count": success_count,
+                "failed_count": len(results) - success_count,
+                "results": results,
+            }
+
+            if verification_pass:
+                verified_urls = [r["url"] for r in results if r.get("success", False)]
+                browser = await self.get_browser()
+                context = await browser.new_context(user_agent=self.user_agent)
+                try:
+                    verification_results = await self._perform_verification_pass(
+                        verified_urls, context
+                    )
+                finally:
+                    await context.close()
+                verified = sum(1 for v in verification_results if v.get("verified", False))
+                response["verification_results"] = verification_results
+                response["verification_success_rate"] = (
+                    verified / len(verification_results) if verification_results else 0.0
+                )
+
+            return response
+        except Exception as e:
+            logger.error(f"Error crawling website {start_url}: {e}", exc_info=True)
+            return {
+                "start_url": start_url,
+                "pages_crawled": 0,
+                "success_count": 0,
+                "failed_count": 0,
+                "results": [],
+                "error": str(e),
+            }
 
     async def _perform_verification_pass(self, urls: List[str], context: Any) -> List[Dict[str, Any]]:
         """Verification pass to check content stability"""
@@ -1,6 +1,6 @@
 from fastapi import APIRouter, Body, HTTPException, Query, Path
 from typing import Dict, Any, List, Optional, Union
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 import random
 
 
@@ -8,6 +8,8 @@ import random
 class ScrapeSingleUrlRequest(BaseModel):
     """Request to scrape a single URL"""
 
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     url: str = Field(..., description="URL to scrape")
     wait_for_selector: Optional[str] = Field(None, description="CSS selector to wait for")
     wait_for_timeout: Optional[int] = Field(30000, description="Maximum wait time in ms")
@@ -19,6 +21,8 @@ class ScrapeSingleUrlRequest(BaseModel):
 class UrlList(BaseModel):
     """Request to scrape multiple URLs"""
 
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     urls: List[str] = Field(..., description="List of URLs to scrape")
     recursion_depth: int = Field(0, ge=0, le=3, description="How many links deep to follow (0-3)")
     store_as_documents: bool = Field(False, description="Save results as documents")
@@ -28,6 +32,8 @@ class UrlList(BaseModel):
 class ScrapeCrawlRequest(BaseModel):
     """Request to crawl a website"""
 
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     start_url: str = Field(..., description="Starting URL for crawl")
     max_pages: int = Field(100, ge=1, description="Maximum number of pages to crawl")
     recursion_depth: int = Field(1, ge=1, description="How many links deep to follow")
@@ -42,6 +48,8 @@ class ScrapeCrawlRequest(BaseModel):
 class SearchAndScrapeRequest(BaseModel):
     """Request to search and scrape results"""
 
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     query: str = Field(..., description="Search query")
     max_results: int = Field(10, ge=1, le=50, description="Maximum search results to process")
     create_documents: bool = Field(False, description="Create documents from scraped content")
@@ -51,6 +59,8 @@ class SearchAndScrapeRequest(BaseModel):
 class SitemapScrapeRequest(BaseModel):
     """Request to scrape URLs from a sitemap"""
 
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     sitemap_url: str = Field(..., description="URL of the sitemap")
     max_urls: int = Field(50, ge=1, description="Maximum number of URLs to scrape")
     create_documents: bool = Field(True, description="Create documents from scraped content")
@@ -58,6 +68,8 @@ class SitemapScrapeRequest(BaseModel):
 
 
 class TableData(BaseModel):
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     headers: List[str] = Field(default_factory=list, description="Table headers")
     rows: List[List[str]] = Field(default_factory=list, description="Table rows")
 
@@ -65,6 +77,8 @@ class TableData(BaseModel):
 class ScraperResponse(BaseModel):
     """Response from scraper"""
 
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
+
     url: str = Field(..., description="Scraped URL")
     title: str = Field(..., description="Page title")
     content: str = Field(..., description="Cleaned content in Markdown format")
@@ -1,9 +1,10 @@
 from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class SerperSearchRequest(BaseModel):
     """Request to search using Serper API"""
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
     query: str = Field(..., description="Search query")
     search_type: str = Field("search", description="Type of search (search, news, images, places)")
     num_results: int = Field(10, description="Number of results to return")
@@ -17,6 +18,7 @@ class SerperSearchRequest(BaseModel):
 
 class SerperSearchResponse(BaseModel):
     """Response from Serper search"""
+    model_config = ConfigDict(extra="ignore", str_strip_whitespace=True)
     query: str = Field(..., description="Original search query")
     search_type: str = Field(..., description="Type of search that was performed")
     organic_results: List[Dict[str, Any]] = Field(default_factory=list, description="Organic search results")
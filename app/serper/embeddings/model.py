@@ -3,7 +3,9 @@ Embeddings model implementation using Hugging Face Transformers.
 Provides text embedding generation and similarity calculation functionality.
 """
 import os
+import asyncio
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Optional
 import numpy as np
 import torch
@@ -18,6 +20,14 @@ class HfEmbeddings:
     Hugging Face embeddings model class that handles text embedding generation
     and similarity calculations using pre-trained transformer models.
     """
+
+    # Maximum number of coalesced texts per forward pass
+    # (override with EMBED_MAX_BATCH)
+    MAX_BATCH = 32
+    # How long the batch worker waits for more requests to arrive
+    # (override with EMBED_MAX_WAIT_MS)
+    BATCH_WINDOW = 0.005
+
     def __init__(self, model_name: Optional[str] = None):
         """
         Initialize Embeddings model
@@ -30,52 +40,181 @@ class HfEmbeddings:
             # Move to GPU if available
             self.device = "cuda" if torch.cuda.is_available() else "cpu"
             self.model.to(self.device)
-            logger.info("Model loaded successfully on %s", self.device)
+            # On GPU, run in half precision: halves memory bandwidth and
+            # roughly doubles tensor-core throughput with negligible
+            # embedding-quality loss
+            if self.device == "cuda":
+                self.dtype = torch.bfloat16 if torch.cuda.is_bf16_supported() else torch.float16
+                self.model = self.model.to(self.dtype)
+            else:
+                self.dtype = torch.float32
+            logger.info("Model loaded successfully on %s (%s)", self.device, self.dtype)
         except Exception as e:
             logger.error("Error loading model: %s", str(e))
             logger.error("Please make sure you are logged into Hugging Face. "
                          "Run: huggingface-cli login")
             raise
 
-    def embed(self, text: str, max_length: int = 2048) -> List[float]:
+        # Micro-batching state, created lazily on first async call since
+        # the queue must belong to a running event loop
+        self._queue: Optional[asyncio.Queue] = None
+        self._batch_task: Optional[asyncio.Task] = None
+        self.max_batch = int(os.getenv("EMBED_MAX_BATCH", str(self.MAX_BATCH)))
+        self.batch_window = float(os.getenv("EMBED_MAX_WAIT_MS", str(self.BATCH_WINDOW * 1000))) / 1000.0
+
+        # Single-worker executor for the forward pass: keeps the heavy
+        # compute off the event loop, and one worker is enough since the
+        # model itself is the bottleneck (torch releases the GIL)
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    def warmup(self, batch_size: int = 8):
+        """
+        Run one throwaway batch so the first real request doesn't pay
+        kernel autotune/JIT cost, and size the thread pool to the host.
+        """
+        torch.set_num_threads(os.cpu_count() or 1)
+        if self.device == "cuda":
+            # Fixed model shape, so let cudnn benchmark once and reuse
+            # the fastest algorithms for every subsequent batch
+            torch.backends.cudnn.benchmark = True
+        self.embed_batch(["warm"] * batch_size)
+        logger.info("Embeddings model warmed up")
+
+    def embed(self, text: str, max_length: int = 2048) -> np.ndarray:
         """
         Generate embeddings for a single text
         """
         return self.embed_batch([text], max_length)[0]
 
-    def embed_batch(self, texts: List[str], max_length: int = 2048) -> List[List[float]]:
+    async def embed_async(self, text: str, max_length: int = 2048) -> np.ndarray:
         """
-        Generate embeddings for a batch of texts
+        Generate embeddings for a single text, coalescing concurrent calls.
+
+        Requests arriving within the batch window are dispatched as one
+        model.encode batch, so N concurrent callers cost roughly one
+        forward pass instead of N batch-of-1 passes.
+        """
+        return (await self.embed_batch_async([text], max_length))[0]
+
+    async def _batch_worker(self):
+        """Background task that drains the queue into batched forward passes"""
+        loop = asyncio.get_running_loop()
+        while True:
+            texts, max_length, future = await self._queue.get()
+            batch = [(texts, future)]
+            total = len(texts)
+            # Give concurrent callers a short window to join this batch
+            await asyncio.sleep(self.batch_window)
+            while total < self.max_batch:
+                try:
+                    next_texts, next_max_length, next_future = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                batch.append((next_texts, next_future))
+                total += len(next_texts)
+                max_length = max(max_length, next_max_length)
+
+            # Flatten and sort by length so similarly sized texts pad
+            # together; unsort before fanning results back out
+            flat = [t for item_texts, _ in batch for t in item_texts]
+            order = sorted(range(len(flat)), key=lambda i: len(flat[i]))
+            try:
+                sorted_embeddings = await loop.run_in_executor(
+                    self._executor, self.embed_batch, [flat[i] for i in order], max_length
+                )
+                # Un-sort with one fancy-indexing gather, keeping the
+                # batch in a single contiguous buffer
+                inverse = np.empty(len(order), dtype=np.intp)
+                inverse[order] = np.arange(len(order))
+                embeddings = sorted_embeddings[inverse]
+                offset = 0
+                for item_texts, item_future in batch:
+                    if not item_future.done():
+                        item_future.set_result(embeddings[offset:offset + len(item_texts)])
+                    offset += len(item_texts)
+            except Exception as e:
+                for _, item_future in batch:
+                    if not item_future.done():
+                        item_future.set_exception(e)
+
+    def embed_batch(self, texts: List[str], max_length: int = 2048) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts as a contiguous
+        (n, dim) float32 array.
+
+        Keeping the batch in one structure-of-arrays buffer instead of
+        nested Python lists avoids boxing every float and lets the
+        similarity kernels stream it straight from cache; callers that
+        need JSON convert with a single C-level tolist() at the edge.
         """
         try:
-            with torch.no_grad():
-                embeddings = self.model.encode(texts, max_length=max_length)
+            # inference_mode skips the autograd tape entirely, a bit
+            # cheaper than no_grad for pure inference
+            with torch.inference_mode():
+                if self.device == "cuda":
+                    with torch.autocast(device_type="cuda", dtype=self.dtype):
+                        embeddings = self.model.encode(texts, max_length=max_length)
+                else:
+                    embeddings = self.model.encode(texts, max_length=max_length)
 
-            # Convert to Python list for JSON serialization
+            # Move to host as float16 to halve the device-to-host transfer
             if isinstance(embeddings, torch.Tensor):
-                embeddings = embeddings.cpu().numpy()
-
-            if isinstance(embeddings, np.ndarray):
-                embeddings = embeddings.tolist()
+                embeddings = embeddings.detach().to(torch.float16).cpu().numpy()
 
+            embeddings = np.ascontiguousarray(embeddings, dtype=np.float32)
+            # L2-normalize once at generation so every downstream cosine
+            # collapses to a plain dot product (norms are all 1)
+            norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+            embeddings /= np.clip(norms, 1e-12, None)
             return embeddings
         except Exception as e:
             logger.error("Error generating embeddings: %s", str(e))
             raise
 
-    def similarity(self, text1: str, text2: str) -> float:
+    async def embed_batch_async(self, texts: List[str], max_length: int = 2048) -> np.ndarray:
         """
-        Calculate cosine similarity between two texts
+        Generate embeddings for a batch of texts without blocking the event loop.
+
+        Batches from concurrent requests are coalesced into one forward
+        pass by the background worker, so under load the model launch
+        cost is paid once per fused batch instead of once per request.
         """
-        emb1 = self.embed(text1)
-        emb2 = self.embed(text2)
+        loop = asyncio.get_running_loop()
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+            self._batch_task = loop.create_task(self._batch_worker())
+        future: "asyncio.Future[np.ndarray]" = loop.create_future()
+        self._queue.put_nowait((texts, max_length, future))
+        return await future
 
-        # Compute cosine similarity
-        dot_product = sum(a * b for a, b in zip(emb1, emb2))
-        magnitude1 = sum(a * a for a in emb1) ** 0.5
-        magnitude2 = sum(b * b for b in emb2) ** 0.5
+    async def similarity_async(self, text1: str, text2: str) -> float:
+        """
+        Calculate cosine similarity between two texts without blocking the event loop
+        """
+        emb1, emb2 = await self.embed_batch_async([text1, text2])
+        # embed_batch returns unit vectors, so cosine is just the dot
+        return float(np.dot(emb1, emb2))
 
-        if magnitude1 == 0 or magnitude2 == 0:
-            return 0.0
+    @staticmethod
+    def quantize_int8(vec) -> "tuple[np.ndarray, float]":
+        """
+        Quantize an embedding vector to int8 with a per-vector scale.
 
-        return dot_product / (magnitude1 * magnitude2)
\ No newline at end of file
+        Returns (int8 array, scale); the original vector is approximately
+        int8_arr * scale. Int8 vectors quarter storage and allow cheap
+        integer dot products for approximate cosine similarity.
+        """
+        arr = np.asarray(vec, dtype=np.float32)
+        scale = float(np.abs(arr).max()) / 127.0
+        if scale == 0.0:
+            return np.zeros(arr.shape, dtype=np.int8), 1.0
+        return np.round(arr / scale).astype(np.int8), scale
+
+    def similarity(self, text1: str, text2: str) -> float:
+        """
+        Calculate cosine similarity between two texts
+        """
+        # One batched forward pass; vectors come back L2-normalized, so
+        # cosine reduces to a single dot product
+        emb1, emb2 = self.embed_batch([text1, text2])
+        return float(np.dot(emb1, emb2))
\ No newline at end of file
@@ -0,0 +1,67 @@
+"""
+Client for a remote embeddings sidecar service.
+Lets many API worker processes share a single model-owning process
+instead of each loading its own copy of the transformer.
+"""
+import logging
+from typing import List, Optional
+
+import httpx
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class RemoteEmbeddings:
+    """
+    Drop-in async replacement for HfEmbeddings that forwards requests to
+    a sidecar running the same /embeddings API. One sidecar owns the only
+    model copy, so worker count no longer multiplies GPU/CPU memory, and
+    all requests funnel into the sidecar's micro-batcher.
+    """
+    def __init__(self, base_url: str, timeout: float = 60.0):
+        self.base_url = base_url.rstrip("/")
+        self._timeout = timeout
+        self._client: Optional[httpx.AsyncClient] = None
+        logger.info("Using remote embeddings service at %s", self.base_url)
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                limits=httpx.Limits(max_connections=100, max_keepalive_connections=20),
+                timeout=self._timeout,
+            )
+        return self._client
+
+    async def close(self):
+        """Close the shared HTTP client (call on application shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
+    async def embed_batch_async(self, texts: List[str], max_length: int = 2048) -> np.ndarray:
+        """
+        Generate embeddings for a batch of texts via the sidecar,
+        returned as a contiguous (n, dim) float32 array like HfEmbeddings
+        """
+        client = self._get_client()
+        response = await client.post("/embeddings", json={"text": texts})
+        response.raise_for_status()
+        return np.asarray(response.json()["embeddings"], dtype=np.float32)
+
+    async def embed_async(self, text: str, max_length: int = 2048) -> np.ndarray:
+        """
+        Generate embeddings for a single text via the sidecar
+        """
+        embeddings = await self.embed_batch_async([text], max_length)
+        return embeddings[0]
+
+    async def similarity_async(self, text1: str, text2: str) -> float:
+        """
+        Calculate cosine similarity between two texts via the sidecar
+        """
+        emb1, emb2 = await self.embed_batch_async([text1, text2])
+        # The sidecar L2-normalizes at generation, so cosine is the dot
+        return float(np.dot(emb1, emb2))
@@ -1,24 +1,108 @@
 import os
 import logging
-import aiohttp
 import asyncio
+import httpx
 from typing import List, Dict, Any, Optional
-from bs4 import BeautifulSoup
-from urllib.parse import quote
+import lxml.html
+from lxml import etree
+from cachetools import TTLCache
+from urllib.parse import quote, urlencode
 from dotenv import load_dotenv
 
 load_dotenv()
 logger = logging.getLogger(__name__)
 
+def _class_xpath(tag: str, class_name: str) -> str:
+    """XPath predicate matching an exact class token on the given tag"""
+    return f"//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {class_name} ')]"
+
+
 class GoogleSearch:
+    # XPath expressions compiled once at import time: libxml2 evaluates
+    # them in C without re-interpreting the selector per call
+    _WEB_RESULTS = etree.XPath(_class_xpath("div", "g"))
+    _WEB_LINK = etree.XPath("(.//a[@href])[1]")
+    _WEB_TITLE = etree.XPath("string((.//h3)[1])")
+    _WEB_SNIPPET = etree.XPath(
+        "string((.//div[contains(concat(' ', normalize-space(@class), ' '), ' VwiC3b ')])[1])"
+    )
+
+    _IMAGE_RESULTS = etree.XPath(_class_xpath("img", "rg_i"))
+
+    _NEWS_RESULTS = etree.XPath(_class_xpath("div", "SoaBEf"))
+    _NEWS_LINK = etree.XPath("(.//a[@href])[1]")
+    _NEWS_TITLE = etree.XPath(
+        "string((.//div[contains(concat(' ', normalize-space(@class), ' '), ' n0jPhd ')])[1])"
+    )
+    _NEWS_SOURCE = etree.XPath(
+        "string((.//div[contains(concat(' ', normalize-space(@class), ' '), ' CEMjEf ')])[1])"
+    )
+    _NEWS_SNIPPET = etree.XPath(
+        "string((.//div[contains(concat(' ', normalize-space(@class), ' '), ' GI74Re ')])[1])"
+    )
+
     def __init__(self):
         self.google_domain = os.getenv("GOOGLE_DOMAIN", "www.google.com")
         self.proxy_url = os.getenv("PROXY_URL")
+        # Long-lived HTTP client, created lazily because httpx needs a
+        # running event loop. Reusing one client keeps TCP/TLS connections
+        # alive across searches instead of re-handshaking per request.
+        self._client: Optional[httpx.AsyncClient] = None
+        # Parsed-result cache: repeated queries skip both the HTTP round
+        # trip and the HTML parse for 10 minutes. In-flight events coalesce
+        # concurrent identical queries into a single upstream fetch.
+        self._cache: TTLCache = TTLCache(maxsize=1024, ttl=600)
+        self._inflight: Dict[tuple, asyncio.Event] = {}
         logger.info("Initializing Google search")
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, creating it on first use"""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=200, max_keepalive_connections=50),
+                timeout=30.0,
+                proxy=self.proxy_url,
+                follow_redirects=True,
+            )
+        return self._client
+
+    async def close(self):
+        """Close the shared HTTP client (call on application shutdown)"""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+            self._client = None
+
     async def search(self, query: str, variant: str = "web", num: int = 10, page: int = 1) -> List[Dict[str, Any]]:
         """
-        Perform Google search
+        Perform Google search, serving repeated queries from the TTL cache
+        """
+        key = (query, variant, num, page)
+
+        # Wait out any identical in-flight query so N concurrent callers
+        # trigger a single upstream fetch ("single-flight")
+        while True:
+            if key in self._cache:
+                logger.info(f"Cache hit for: {query} (variant: {variant})")
+                return self._cache[key]
+            event = self._inflight.get(key)
+            if event is None:
+                break
+            await event.wait()
+
+        event = asyncio.Event()
+        self._inflight[key] = event
+        try:
+            results = await self._fetch_results(query, variant, num, page)
+            if results:
+                self._cache[key] = results
+            return results
+        finally:
+            self._inflight.pop(key, None)
+            event.set()
+
+    async def _fetch_results(self, query: str, variant: str, num: int, page: int) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse search results from Google
         """
         logger.info(f"Searching for: {query} (variant: {variant})")
 
@@ -26,7 +110,6 @@ class GoogleSearch:
         start = (page - 1) * num
 
         # Build search URL
-        url = f"https://{self.google_domain}/search?"
         params = {
             "q": query,
             "num": str(num),
@@ -40,64 +123,55 @@ class GoogleSearch:
         elif variant == "news":
             params["tbm"] = "nws"
 
-        # Prepare URL
-        for key, value in params.items():
-            url += f"{key}={quote(value)}&"
-        url = url[:-1]  # Remove trailing &
+        # Encode the query string in a single C-level call
+        url = f"https://{self.google_domain}/search?{urlencode(params, quote_via=quote)}"
 
-        # Setup HTTP client
-        async with aiohttp.ClientSession() as session:
-            # Setup proxy if specified
-            proxy = self.proxy_url if self.proxy_url else None
-
-            headers = {
-                "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
-                "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-                "Accept-Language": "en-US,en;q=0.5",
-            }
+        headers = {
+            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36",
+            "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+            "Accept-Language": "en-US,en;q=0.5",
+        }
 
-            try:
-                async with session.get(url, headers=headers, proxy=proxy) as response:
-                    if response.status != 200:
-                        logger.error(f"Error fetching search results: {response.status}")
-                        return []
-
-                    html = await response.text()
-
-                    # Extract results based on variant
-                    if variant == "images":
-                        return self._parse_image_results(html)
-                    elif variant == "news":
-                        return self._parse_news_results(html)
-                    else:
-                        return self._parse_web_results(html)
-            except Exception as e:
-                logger.error(f"Error during search: {str(e)}")
+        try:
+            client = self._get_client()
+            response = await client.get(url, headers=headers)
+            if response.status_code != 200:
+                logger.error(f"Error fetching search results: {response.status_code}")
                 return []
 
+            html = response.text
+
+            # Extract results based on variant
+            if variant == "images":
+                return self._parse_image_results(html)
+            elif variant == "news":
+                return self._parse_news_results(html)
+            else:
+                return self._parse_web_results(html)
+        except Exception as e:
+            logger.error(f"Error during search: {str(e)}")
+            return []
+
     def _parse_web_results(self, html: str) -> List[Dict[str, Any]]:
         """
         Parse web search results
         """
-        soup = BeautifulSoup(html, "html.parser")
+        tree = lxml.html.fromstring(html)
         results = []
 
         # Extract search results
-        for result in soup.select("div.g"):
+        for result in self._WEB_RESULTS(tree):
             try:
-                link_element = result.select_one("a")
-                if not link_element or not link_element.get("href"):
+                link_elements = self._WEB_LINK(result)
+                if not link_elements:
                     continue
 
-                link = link_element["href"]
-                if not link.startswith("http"):
+                link = link_elements[0].get("href")
+                if not link or not link.startswith("http"):
                     continue
 
-                title_element = result.select_one("h3")
-                title = title_element.text if title_element else "No title"
-
-                snippet_element = result.select_one("div.VwiC3b")
-                snippet = snippet_element.text if snippet_element else "No description"
+                title = self._WEB_TITLE(result).strip() or "No title"
+                snippet = self._WEB_SNIPPET(result).strip() or "No description"
 
                 results.append({
                     "title": title,
@@ -114,21 +188,22 @@ class GoogleSearch:
         """
         Parse image search results
         """
-        soup = BeautifulSoup(html, "html.parser")
+        tree = lxml.html.fromstring(html)
         results = []
 
-        for img in soup.select("img.rg_i"):
+        for img in self._IMAGE_RESULTS(tree):
             try:
                 src = img.get("src") or img.get("data-src")
                 if not src:
                     continue
 
-                alt = img.get("alt", "No description")
+                alt = img.get("alt") or "No description"
 
+                parent = img.getparent()
                 results.append({
                     "title": alt,
                     "thumbnail": src,
-                    "source": img.parent.get("href", "#") if img.parent else "#",
+                    "source": parent.get("href", "#") if parent is not None else "#",
                 })
             except Exception as e:
                 logger.error(f"Error parsing image result: {str(e)}")
@@ -140,27 +215,22 @@ class GoogleSearch:
         """
         Parse news search results
         """
-        soup = BeautifulSoup(html, "html.parser")
+        tree = lxml.html.fromstring(html)
         results = []
 
-        for article in soup.select("div.SoaBEf"):
+        for article in self._NEWS_RESULTS(tree):
             try:
-                link_element = article.select_one("a")
-                if not link_element or not link_element.get("href"):
+                link_elements = self._NEWS_LINK(article)
+                if not link_elements:
                     continue
 
-                link = link_element["href"]
-                if not link.startswith("http"):
+                link = link_elements[0].get("href")
+                if not link or not link.startswith("http"):
                     continue
 
-                title_element = article.select_one("div.n0jPhd")
-                title = title_element.text if title_element else "No title"
-
-                source_element = article.select_one("div.CEMjEf")
-                source = source_element.text if source_element else "Unknown source"
-
-                snippet_element = article.select_one("div.GI74Re")
-                snippet = snippet_element.text if snippet_element else "No description"
+                title = self._NEWS_TITLE(article).strip() or "No title"
+                source = self._NEWS_SOURCE(article).strip() or "Unknown source"
+                snippet = self._NEWS_SNIPPET(article).strip() or "No description"
 
                 results.append({
                     "title": title,
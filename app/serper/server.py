@@ -4,19 +4,33 @@ This server implements endpoints for crawling URLs, generating text embeddings,
 performing web searches, and calculating text similarity.
 """
 import os
+import asyncio
 import logging
 from typing import List, Dict, Any, Optional, Union
 from urllib.parse import unquote
 
+import numpy as np
 import uvicorn
-from fastapi import FastAPI, HTTPException, Query, Path
+
+try:
+    import uvloop
+    HAS_UVLOOP = True
+except ImportError:
+    uvloop = None
+    HAS_UVLOOP = False
+
+from fastapi import FastAPI, HTTPException, Query, Path, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
 from crawler.browser import Crawler
 from embeddings.model import HfEmbeddings
+from embeddings.remote import RemoteEmbeddings
+from embeddings.similarity import cosine_scores, cosine_scores_i8, quantize_batch
 from search.google import GoogleSearch
+from utils.embed_cache import EmbeddingCache
 from utils.markdown import HtmlToMarkdown
 
 # Load environment variables
@@ -33,7 +47,10 @@ logger = logging.getLogger(__name__)
 app = FastAPI(
     title="Standalone Crawler with Embeddings",
     description="Web crawling, scraping, and content analysis using local embeddings",
-    version="1.0.0"
+    version="1.0.0",
+    # orjson serializes numpy arrays and float batches in C, which
+    # dominates /embeddings response time under stdlib json
+    default_response_class=ORJSONResponse,
 )
 
 # Add CORS middleware
@@ -45,12 +62,45 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize components
+# Initialize components. When EMBEDDINGS_SERVICE_URL points at a sidecar
+# that owns the model, this process stays model-free and every worker
+# shares the sidecar's single copy instead of loading its own.
 crawler = Crawler()
-embeddings_model = HfEmbeddings()
+embeddings_service_url = os.getenv("EMBEDDINGS_SERVICE_URL")
+if embeddings_service_url:
+    embeddings_model = RemoteEmbeddings(embeddings_service_url)
+else:
+    embeddings_model = HfEmbeddings()
 search_engine = GoogleSearch()
 markdown_converter = HtmlToMarkdown()
 
+# EMBED_QUANT=int8 switches storage and similarity math to int8
+# vectors with per-vector scales: quarter the bandwidth, VNNI kernels
+EMBED_QUANT = os.getenv("EMBED_QUANT", "")
+
+# Two-tier embedding cache: repeat strings skip the model entirely
+embed_cache = EmbeddingCache(
+    model_id=embeddings_service_url or os.getenv("EMBEDDING_MODEL", "")
+)
+
+
+async def embed_cached(texts: List[str]):
+    """
+    Embed texts through the cache: cached strings are served from the
+    LRU/Redis tiers and only the misses hit the model, with results
+    written back through both tiers. Returns a contiguous (n, dim)
+    float32 array.
+    """
+    cached = await embed_cache.get_many(texts)
+    miss_positions = [i for i, vec in enumerate(cached) if vec is None]
+    if miss_positions:
+        miss_texts = [texts[i] for i in miss_positions]
+        fresh = await embeddings_model.embed_batch_async(miss_texts)
+        await embed_cache.set_many(miss_texts, fresh)
+        for position, vec in zip(miss_positions, fresh):
+            cached[position] = vec
+    return np.ascontiguousarray(np.asarray(cached, dtype=np.float32))
+
 # API Models
 class EmbeddingRequest(BaseModel):
     """Model for embedding request containing text to be embedded."""
@@ -59,6 +109,13 @@ class EmbeddingRequest(BaseModel):
 class EmbeddingResponse(BaseModel):
     """Model for embedding response containing generated embeddings."""
     embeddings: List[List[float]]
+    # Per-vector dequantization scales, present when EMBED_QUANT=int8
+    scales: Optional[List[float]] = None
+
+class BatchSimilarityRequest(BaseModel):
+    """Model for batched similarity request: one query against many candidates."""
+    query: str
+    candidates: List[str]
 
 class SearchResponse(BaseModel):
     """Model for search response containing search results."""
@@ -72,12 +129,31 @@ class CrawlResponse(BaseModel):
     content: str
     content_type: str
     screenshot: Optional[str] = None
+    # Set when the page's HTML matched content already crawled this
+    # session; content is empty and content_type is "duplicate"
+    duplicate_of_hash: Optional[int] = None
+
+@app.on_event("startup")
+async def warmup_event():
+    """Warm the local model so the first request skips autotune cost."""
+    if isinstance(embeddings_model, HfEmbeddings):
+        await asyncio.to_thread(embeddings_model.warmup)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    """Release the pooled connections and browser state held by the services."""
+    await crawler.close()
+    await search_engine.close()
+    await embed_cache.close()
+    if isinstance(embeddings_model, RemoteEmbeddings):
+        await embeddings_model.close()
 
 # API Routes
 @app.get("/health")
 async def health_check():
     """Health check endpoint to verify server is running."""
-    return {"status": "ok"}
+    return {"status": "ok", "embed_cache": embed_cache.stats()}
 
 @app.get("/crawl/{url:path}", response_model=CrawlResponse)
 async def crawl_url(
@@ -111,19 +187,54 @@ async def crawl_url(
         logger.error("Error crawling URL: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e)) from e
 
-@app.post("/embeddings", response_model=EmbeddingResponse)
-async def generate_embeddings(request: EmbeddingRequest):
+# response_model is omitted deliberately: validating ~100k floats
+# through pydantic would re-box the array the ORJSON path avoids.
+# The shape matches EmbeddingResponse.
+@app.post("/embeddings")
+async def generate_embeddings(
+    request: EmbeddingRequest,
+    format: Optional[str] = Query("json", description="Response format (json, binary)"),
+):
     """
     Generate embeddings for the provided text or texts.
+
+    With format=binary the raw float32 buffer is returned as
+    application/octet-stream with the shape in the X-Shape header,
+    skipping JSON float encoding entirely.
     """
     try:
         # Process text or array of texts
         texts = request.text if isinstance(request.text, list) else [request.text]
 
-        # Generate embeddings
-        embeddings = embeddings_model.embed_batch(texts)
+        # Generate embeddings off the event loop, serving repeats from cache
+        embeddings = await embed_cached(texts)
 
-        return {"embeddings": embeddings}
+        if EMBED_QUANT == "int8":
+            quantized, scales = quantize_batch(embeddings)
+            if format == "binary":
+                n, dim = quantized.shape
+                return Response(
+                    content=quantized.tobytes() + scales.tobytes(),
+                    media_type="application/octet-stream",
+                    headers={"X-Shape": f"{n},{dim}", "X-Quant": "int8"},
+                )
+            # Return the response directly: FastAPI's jsonable_encoder
+            # rejects ndarrays, but ORJSONResponse.render serializes them
+            # in C via OPT_SERIALIZE_NUMPY
+            return ORJSONResponse({"embeddings": quantized, "scales": scales})
+
+        if format == "binary":
+            n, dim = embeddings.shape
+            return Response(
+                content=embeddings.tobytes(),
+                media_type="application/octet-stream",
+                headers={"X-Shape": f"{n},{dim}"},
+            )
+
+        # Return the response directly: FastAPI's jsonable_encoder rejects
+        # ndarrays, but ORJSONResponse.render walks the contiguous float32
+        # buffer in C via OPT_SERIALIZE_NUMPY — no tolist() boxing at all
+        return ORJSONResponse({"embeddings": embeddings})
     except Exception as e:
         logger.error("Error generating embeddings: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -159,14 +270,58 @@ async def compare_similarity(
     Calculate cosine similarity between two text strings.
     """
     try:
-        similarity = embeddings_model.similarity(text1, text2)
+        embeddings = await embed_cached([text1, text2])
+        if EMBED_QUANT == "int8":
+            similarity = cosine_scores_i8(embeddings[0], [embeddings[1]])[0]
+        else:
+            similarity = cosine_scores(embeddings[0], [embeddings[1]])[0]
         return {"similarity": similarity}
     except Exception as e:
         logger.error("Error calculating similarity: %s", str(e))
         raise HTTPException(status_code=500, detail=str(e)) from e
 
+@app.post("/similarity/batch")
+async def compare_similarity_batch(request: BatchSimilarityRequest):
+    """
+    Calculate cosine similarity between a query and a batch of candidates.
+    Embeds everything in a single forward pass and scores the whole batch
+    with one vectorized kernel call.
+    """
+    try:
+        # SimSIMD rejects empty collections where the NumPy fallback
+        # returns []; short-circuit so behavior matches either way
+        if not request.candidates:
+            return {"query": request.query, "scores": []}
+        embeddings = await embed_cached([request.query] + request.candidates)
+        if EMBED_QUANT == "int8":
+            scores = cosine_scores_i8(embeddings[0], embeddings[1:])
+        else:
+            scores = cosine_scores(embeddings[0], embeddings[1:])
+        return {"query": request.query, "scores": scores}
+    except Exception as e:
+        logger.error("Error calculating batch similarity: %s", str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
 # Main entry point
 if __name__ == "__main__":
+    # Use the libuv-based event loop when available: far less Python-level
+    # bookkeeping per socket than the default selector loop
+    if HAS_UVLOOP:
+        uvloop.install()
+        logger.info("Using uvloop event loop")
+
     port = int(os.getenv("PORT", "3000"))
-    logger.info("Starting server on port %s", port)
-    uvicorn.run("server:app", host="0.0.0.0", port=port, reload=True)
\ No newline at end of file
+    dev_mode = os.getenv("DEV_MODE", "False").lower() == "true"
+    # One worker per core (or WEB_CONCURRENCY) outside dev mode; reload
+    # requires a single worker, so dev keeps the old behaviour
+    workers = 1 if dev_mode else int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
+    logger.info("Starting server on port %s with %s worker(s)", port, workers)
+    uvicorn.run(
+        "server:app",
+        host="0.0.0.0",
+        port=port,
+        reload=dev_mode,
+        workers=workers,
+        loop="uvloop" if HAS_UVLOOP else "auto",
+        http="httptools",
+    )
\ No newline at end of file
@@ -1,4 +1,5 @@
 import os
+from functools import lru_cache
 from typing import List, Optional
 
 # Third-party imports
@@ -59,21 +60,22 @@ class Config(BaseSettings):
         default=os.getenv("SCRAPER_DATA_PATH", "./data/scraped")
     )
 
-    # Special configuration for pydantic
+    # Special configuration for pydantic; frozen keeps the shared
+    # instance immutable so attribute access is a plain slot read
     model_config = {
         "env_file": ".env",
         "case_sensitive": False,
+        "frozen": True,
     }
 
 
-# Singleton instance using function attribute pattern
+# Singleton instance, built once and served from the lru_cache slot
+@lru_cache(maxsize=1)
 def get_config() -> Config:
     """
     Get the singleton configuration instance.
-    
+
     Returns:
         Config: The configuration object with settings from environment variables
     """
-    if not hasattr(get_config, "_config_instance"):
-        get_config._config_instance = Config()
-    return get_config._config_instance
+    return Config()
@@ -0,0 +1,164 @@
+"""
+Two-tier embedding cache: in-process LRU (L1) plus optional Redis (L2).
+
+Repeat queries dominate embedding traffic, so serving identical strings
+from cache turns a model forward pass into a hash lookup. Entries are
+keyed by a blake2b digest of the text namespaced by model id, stored as
+raw float32 buffers and zlib-compressed when large.
+"""
+import os
+import zlib
+import hashlib
+import logging
+import threading
+from typing import Dict, List, Optional
+
+import numpy as np
+from cachetools import LRUCache
+
+try:
+    import redis.asyncio as aioredis
+    HAS_REDIS = True
+except ImportError:
+    aioredis = None
+    HAS_REDIS = False
+
+logger = logging.getLogger(__name__)
+
+# Compress stored vectors above this size; small ones aren't worth the CPU
+COMPRESS_THRESHOLD = 1024
+# Sentinel prefixes so a buffer knows whether it was compressed
+_RAW = b"r"
+_ZLIB = b"z"
+
+
+def cache_key(text: str, model_id: str) -> str:
+    """Derive the cache key for a text under a given model."""
+    digest = hashlib.blake2b(text.encode(), digest_size=16).hexdigest()
+    return f"emb:{model_id}:{digest}"
+
+
+def _pack(vec: List[float]) -> bytes:
+    """Serialize an embedding to a (possibly compressed) float32 buffer."""
+    raw = np.asarray(vec, dtype=np.float32).tobytes()
+    if len(raw) > COMPRESS_THRESHOLD:
+        return _ZLIB + zlib.compress(raw, level=1)
+    return _RAW + raw
+
+
+def _unpack(buf: bytes) -> np.ndarray:
+    """Deserialize a stored buffer back to a float32 vector."""
+    tag, payload = buf[:1], buf[1:]
+    if tag == _ZLIB:
+        payload = zlib.decompress(payload)
+    return np.frombuffer(payload, dtype=np.float32)
+
+
+class LRUEmbeddingCache:
+    """Thread-safe in-process LRU over packed embedding buffers."""
+
+    def __init__(self, maxsize: Optional[int] = None):
+        maxsize = maxsize or int(os.getenv("EMBED_CACHE_SIZE", "4096"))
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        with self._lock:
+            buf = self._cache.get(key)
+            if buf is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+        return _unpack(buf)
+
+    def set(self, key: str, vec: List[float]):
+        buf = _pack(vec)
+        with self._lock:
+            self._cache[key] = buf
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"size": len(self._cache), "hits": self.hits, "misses": self.misses}
+
+
+class RedisEmbeddingCache:
+    """Async Redis-backed cache tier shared across worker processes."""
+
+    def __init__(self, url: str, ttl: int = 86400):
+        if not HAS_REDIS:
+            raise RuntimeError("redis package is not installed")
+        self._redis = aioredis.from_url(url)
+        self.ttl = ttl
+
+    async def get_many(self, keys: List[str]) -> List[Optional[np.ndarray]]:
+        try:
+            bufs = await self._redis.mget(keys)
+        except Exception as e:
+            logger.warning("Redis cache read failed: %s", str(e))
+            return [None] * len(keys)
+        return [_unpack(buf) if buf is not None else None for buf in bufs]
+
+    async def set_many(self, items: Dict[str, List[float]]):
+        try:
+            async with self._redis.pipeline(transaction=False) as pipe:
+                for key, vec in items.items():
+                    pipe.set(key, _pack(vec), ex=self.ttl)
+                await pipe.execute()
+        except Exception as e:
+            logger.warning("Redis cache write failed: %s", str(e))
+
+    async def close(self):
+        await self._redis.aclose()
+
+
+class EmbeddingCache:
+    """
+    Two-tier facade: L1 LRU always on, L2 Redis when EMBED_CACHE_REDIS_URL
+    is set. Misses in L1 fall through to L2; writes go to both tiers.
+    """
+
+    def __init__(self, model_id: str):
+        self.model_id = model_id
+        self.l1 = LRUEmbeddingCache()
+        redis_url = os.getenv("EMBED_CACHE_REDIS_URL")
+        self.l2: Optional[RedisEmbeddingCache] = None
+        if redis_url and HAS_REDIS:
+            self.l2 = RedisEmbeddingCache(redis_url)
+        elif redis_url:
+            logger.warning("EMBED_CACHE_REDIS_URL set but redis package missing; "
+                           "running with in-process cache only")
+
+    async def get_many(self, texts: List[str]) -> List[Optional[np.ndarray]]:
+        """Look texts up in L1 then L2, returning one entry per text."""
+        keys = [cache_key(text, self.model_id) for text in texts]
+        results = [self.l1.get(key) for key in keys]
+        if self.l2 is not None:
+            miss_positions = [i for i, vec in enumerate(results) if vec is None]
+            if miss_positions:
+                l2_results = await self.l2.get_many([keys[i] for i in miss_positions])
+                for position, vec in zip(miss_positions, l2_results):
+                    if vec is not None:
+                        results[position] = vec
+                        self.l1.set(keys[position], vec)
+        return results
+
+    async def set_many(self, texts: List[str], vectors: List[List[float]]):
+        """Write embeddings through to both tiers."""
+        items = {}
+        for text, vec in zip(texts, vectors):
+            key = cache_key(text, self.model_id)
+            self.l1.set(key, vec)
+            items[key] = vec
+        if self.l2 is not None and items:
+            await self.l2.set_many(items)
+
+    def stats(self) -> Dict[str, object]:
+        stats: Dict[str, object] = dict(self.l1.stats())
+        stats["redis"] = self.l2 is not None
+        return stats
+
+    async def close(self):
+        if self.l2 is not None:
+            await self.l2.close()
@@ -1,142 +1,155 @@
+import io
 import logging
 import re
-from bs4 import BeautifulSoup
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 from typing import Optional, Dict, Any
 
 logger = logging.getLogger(__name__)
 
+# Collapse runs of blank lines left between block elements
+_EXTRA_NEWLINES = re.compile(r'\n{3,}')
+
 class HtmlToMarkdown:
-    def __init__(self):
-        # Common replacements for markdown conversion
-        self.replacements = [
-            # Headers
-            (re.compile(r'<h1[^>]*>(.*?)</h1>', re.DOTALL), r'# \1\n'),
-            (re.compile(r'<h2[^>]*>(.*?)</h2>', re.DOTALL), r'## \1\n'),
-            (re.compile(r'<h3[^>]*>(.*?)</h3>', re.DOTALL), r'### \1\n'),
-            (re.compile(r'<h4[^>]*>(.*?)</h4>', re.DOTALL), r'#### \1\n'),
-            (re.compile(r'<h5[^>]*>(.*?)</h5>', re.DOTALL), r'##### \1\n'),
-            (re.compile(r'<h6[^>]*>(.*?)</h6>', re.DOTALL), r'###### \1\n'),
-
-            # Bold and italic
-            (re.compile(r'<strong[^>]*>(.*?)</strong>', re.DOTALL), r'**\1**'),
-            (re.compile(r'<b[^>]*>(.*?)</b>', re.DOTALL), r'**\1**'),
-            (re.compile(r'<em[^>]*>(.*?)</em>', re.DOTALL), r'*\1*'),
-            (re.compile(r'<i[^>]*>(.*?)</i>', re.DOTALL), r'*\1*'),
-
-            # Lists
-            (re.compile(r'<ul[^>]*>(.*?)</ul>', re.DOTALL), self._process_ul),
-            (re.compile(r'<ol[^>]*>(.*?)</ol>', re.DOTALL), self._process_ol),
-
-            # Links
-            (re.compile(r'<a[^>]*href="([^"]*)"[^>]*>(.*?)</a>', re.DOTALL), r'[\2](\1)'),
-
-            # Images
-            (re.compile(r'<img[^>]*src="([^"]*)"[^>]*alt="([^"]*)"[^>]*>', re.DOTALL), r'![\2](\1)'),
-            (re.compile(r'<img[^>]*src="([^"]*)"[^>]*>', re.DOTALL), r'![](\1)'),
-
-            # Code
-            (re.compile(r'<pre[^>]*><code[^>]*>(.*?)</code></pre>', re.DOTALL), r'```\n\1\n```'),
-            (re.compile(r'<code[^>]*>(.*?)</code>', re.DOTALL), r'`\1`'),
-
-            # Blockquotes
-            (re.compile(r'<blockquote[^>]*>(.*?)</blockquote>', re.DOTALL), self._process_blockquote),
-
-            # Paragraphs and breaks
-            (re.compile(r'<p[^>]*>(.*?)</p>', re.DOTALL), r'\1\n\n'),
-            (re.compile(r'<br[^>]*>', re.DOTALL), r'\n'),
-
-            # Tables - more complex, handled separately
-        ]
-
-    def _process_ul(self, match):
-        content = match.group(1)
-        soup = BeautifulSoup(content, 'html.parser')
-        result = "\n"
-        for li in soup.find_all('li'):
-            result += f"- {li.get_text().strip()}\n"
-        return result + "\n"
-
-    def _process_ol(self, match):
-        content = match.group(1)
-        soup = BeautifulSoup(content, 'html.parser')
-        result = "\n"
-        for i, li in enumerate(soup.find_all('li')):
-            result += f"{i+1}. {li.get_text().strip()}\n"
-        return result + "\n"
-
-    def _process_blockquote(self, match):
-        content = match.group(1)
-        lines = content.split('\n')
-        result = "\n"
-        for line in lines:
-            stripped = line.strip()
-            if stripped:
-                result += f"> {stripped}\n"
-        return result + "\n"
-
-    def _process_table(self, soup):
-        tables = soup.find_all('table')
-        if not tables:
-            return soup
-
-        for table in tables:
-            rows = table.find_all('tr')
-            if not rows:
-                continue
-
-            markdown_table = []
-
-            # Process header row
-            header_cells = rows[0].find_all(['th', 'td'])
-            if header_cells:
-                header_row = "| " + " | ".join([cell.get_text().strip() for cell in header_cells]) + " |"
-                markdown_table.append(header_row)
-
-                # Add separator row
-                separator_row = "| " + " | ".join(["---" for _ in header_cells]) + " |"
-                markdown_table.append(separator_row)
-
-            # Process data rows
-            for row in rows[1:]:
-                cells = row.find_all('td')
-                if cells:
-                    data_row = "| " + " | ".join([cell.get_text().strip() for cell in cells]) + " |"
-                    markdown_table.append(data_row)
-
-            # Replace table with markdown
-            table_markdown = "\n" + "\n".join(markdown_table) + "\n\n"
-            new_tag = soup.new_tag('div', attrs={'class': 'markdown-table'})
-            new_tag.string = table_markdown
-            table.replace_with(new_tag)
-
-        return soup
+    """
+    HTML to Markdown converter implemented as a single walk over the
+    Lexbor parse tree. The document is parsed once in C and markdown is
+    emitted directly from the nodes, so no intermediate HTML string is
+    ever rebuilt or re-scanned.
+    """
+
+    # Tags whose subtrees are dropped before emission
+    STRIP_TAGS = ['script', 'style', 'iframe', 'noscript']
+
+    def _process_table(self, table: LexborNode) -> str:
+        """Render a table node as a markdown pipe table."""
+        rows = table.css('tr')
+        if not rows:
+            return ""
+
+        markdown_table = []
+
+        # Process header row
+        header_cells = rows[0].css('th') or rows[0].css('td')
+        if header_cells:
+            header_row = "| " + " | ".join([cell.text(strip=True) for cell in header_cells]) + " |"
+            markdown_table.append(header_row)
+
+            # Add separator row
+            separator_row = "| " + " | ".join(["---" for _ in header_cells]) + " |"
+            markdown_table.append(separator_row)
+
+        # Process data rows
+        for row in rows[1:]:
+            cells = row.css('td')
+            if cells:
+                data_row = "| " + " | ".join([cell.text(strip=True) for cell in cells]) + " |"
+                markdown_table.append(data_row)
+
+        return "\n" + "\n".join(markdown_table) + "\n\n"
+
+    def _inline(self, node: LexborNode) -> str:
+        """Render a node's children to markdown and return the string."""
+        buffer = io.StringIO()
+        self._emit_children(node, buffer)
+        return buffer.getvalue()
+
+    def _emit_children(self, node: LexborNode, buffer: io.StringIO):
+        # The per-tag handlers are specialized into a dict at class-build
+        # time, so dispatch is one hash lookup instead of an elif chain
+        handlers = self._HANDLERS
+        for child in node.iter(include_text=True):
+            handler = handlers.get(child.tag)
+            if handler is not None:
+                handler(self, child, buffer)
+            else:
+                # Unknown/container tags contribute only their children
+                self._emit_children(child, buffer)
+
+    def _emit_text(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(node.text_content or "")
+
+    def _emit_heading(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(self._HEADING_PREFIX[node.tag] + self._inline(node).strip() + '\n\n')
+
+    def _emit_bold(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(f"**{self._inline(node)}**")
+
+    def _emit_italic(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(f"*{self._inline(node)}*")
+
+    def _emit_link(self, node: LexborNode, buffer: io.StringIO):
+        href = node.attributes.get('href') or ""
+        buffer.write(f"[{self._inline(node)}]({href})")
+
+    def _emit_image(self, node: LexborNode, buffer: io.StringIO):
+        src = node.attributes.get('src') or ""
+        alt = node.attributes.get('alt') or ""
+        buffer.write(f"![{alt}]({src})")
+
+    def _emit_pre(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(f"```\n{node.text(deep=True).strip()}\n```\n\n")
+
+    def _emit_code(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(f"`{node.text(deep=True)}`")
+
+    def _emit_paragraph(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(self._inline(node).strip() + '\n\n')
+
+    def _emit_break(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write('\n')
+
+    def _emit_ul(self, node: LexborNode, buffer: io.StringIO):
+        items = "".join(f"- {li.text(deep=True).strip()}\n" for li in node.css('li'))
+        buffer.write('\n' + items + '\n')
+
+    def _emit_ol(self, node: LexborNode, buffer: io.StringIO):
+        items = "".join(
+            f"{i + 1}. {li.text(deep=True).strip()}\n" for i, li in enumerate(node.css('li'))
+        )
+        buffer.write('\n' + items + '\n')
+
+    def _emit_blockquote(self, node: LexborNode, buffer: io.StringIO):
+        quoted = "".join(
+            f"> {line.strip()}\n" for line in self._inline(node).split('\n') if line.strip()
+        )
+        buffer.write('\n' + quoted + '\n')
+
+    def _emit_table(self, node: LexborNode, buffer: io.StringIO):
+        buffer.write(self._process_table(node))
+
+    # Tag dispatch table, built once for the known tag set
+    _HEADING_PREFIX = {f'h{n}': '#' * n + ' ' for n in range(1, 7)}
+    _HANDLERS = {
+        '-text': _emit_text,
+        'strong': _emit_bold, 'b': _emit_bold,
+        'em': _emit_italic, 'i': _emit_italic,
+        'a': _emit_link,
+        'img': _emit_image,
+        'pre': _emit_pre,
+        'code': _emit_code,
+        'p': _emit_paragraph,
+        'br': _emit_break,
+        'ul': _emit_ul,
+        'ol': _emit_ol,
+        'blockquote': _emit_blockquote,
+        'table': _emit_table,
+        'h1': _emit_heading, 'h2': _emit_heading, 'h3': _emit_heading,
+        'h4': _emit_heading, 'h5': _emit_heading, 'h6': _emit_heading,
+    }
 
     def convert(self, html: str) -> str:
         """
         Convert HTML to Markdown
         """
-        # First pass - clean up HTML with BeautifulSoup
-        soup = BeautifulSoup(html, 'html.parser')
-
-        # Remove script and style elements
-        for element in soup(['script', 'style', 'iframe', 'noscript']):
-            element.decompose()
+        # Single C-backed parse; everything downstream walks this tree
+        tree = LexborHTMLParser(html)
+        tree.strip_tags(self.STRIP_TAGS)
 
-        # Process tables
-        soup = self._process_table(soup)
-
-        cleaned_html = str(soup)
-
-        # Apply regular expressions
-        markdown = cleaned_html
-        for pattern, replacement in self.replacements:
-            if callable(replacement):
-                markdown = pattern.sub(replacement, markdown)
-            else:
-                markdown = pattern.sub(replacement, markdown)
+        root = tree.body or tree.root
+        if root is None:
+            return ""
 
-        # Post-processing cleanup
-        markdown = re.sub(r'\n{3,}', '\n\n', markdown)  # Remove extra newlines
-        markdown = re.sub(r'<.*?>', '', markdown)  # Remove any remaining HTML tags
+        buffer = io.StringIO()
+        self._emit_children(root, buffer)
 
-        return markdown.strip()
+        return _EXTRA_NEWLINES.sub('\n\n', buffer.getvalue()).strip()
@@ -0,0 +1,78 @@
+"""
+HTML to Markdown conversion helpers for the scraper service.
+"""
+import logging
+import re
+from typing import Optional
+from urllib.parse import urljoin
+
+# Third-party imports in try/except for graceful handling
+try:
+    from bs4 import BeautifulSoup
+    HAS_BS4 = True
+except ImportError:
+    BeautifulSoup = None
+    HAS_BS4 = False
+
+logger = logging.getLogger(__name__)
+
+# Tags whose subtrees carry no readable content
+_STRIP_TAGS = ["script", "style", "noscript", "iframe"]
+
+# Block-level tags emitted as their own markdown lines
+_BLOCK_TAGS = ["h1", "h2", "h3", "h4", "h5", "h6", "p", "li", "pre", "blockquote"]
+
+
+def html_to_markdown(html_content: str, url: Optional[str] = None,
+                     title: Optional[str] = None) -> str:
+    """
+    Convert an HTML document to Markdown.
+
+    Anchors become inline ``[text](href)`` links (resolved against
+    ``url`` when given) and block elements map to their markdown
+    equivalents. Falls back to a plain tag strip when BeautifulSoup is
+    not installed so scraping still returns readable text.
+    """
+    if not HAS_BS4:
+        text = re.sub(r"(?is)<(script|style)[^>]*>.*?</\1>", "", html_content)
+        return re.sub(r"<[^>]+>", " ", text).strip()
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    for tag in soup(_STRIP_TAGS):
+        tag.decompose()
+
+    # Inline links first so they survive get_text below
+    for anchor in soup.find_all("a", href=True):
+        href = anchor["href"]
+        if url:
+            href = urljoin(url, href)
+        link_text = anchor.get_text(" ", strip=True)
+        if link_text:
+            anchor.replace_with(f"[{link_text}]({href})")
+
+    lines = []
+    if title:
+        lines.append(f"# {title}")
+
+    body = soup.body or soup
+    for element in body.find_all(_BLOCK_TAGS):
+        if element.name == "pre":
+            code = element.get_text().strip("\n")
+            if code:
+                lines.append(f"```\n{code}\n```")
+            continue
+        text = element.get_text(" ", strip=True)
+        if not text:
+            continue
+        if element.name.startswith("h"):
+            lines.append("#" * int(element.name[1]) + f" {text}")
+        elif element.name == "li":
+            lines.append(f"- {text}")
+        elif element.name == "blockquote":
+            lines.append(f"> {text}")
+        else:
+            lines.append(text)
+
+    if not lines:
+        return body.get_text(" ", strip=True)
+    return "\n\n".join(lines)
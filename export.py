@@ -1,11 +1,23 @@
 import os
 import sys
 import argparse
+import asyncio
+from collections import deque
 from pathlib import Path
 import datetime
 import fnmatch
 import re
 
+import aiofiles
+
+# How many files are read from disk concurrently during export
+READ_CONCURRENCY = 32
+
+# Files above this size are streamed through a fixed-size buffer at
+# write time instead of being fully read into memory up front
+STREAM_THRESHOLD = 256 * 1024
+STREAM_CHUNK = 1 << 20
+
 
 def parse_arguments():
     """Parse command-line arguments."""
@@ -59,24 +71,41 @@ def parse_arguments():
     return parser.parse_args()
 
 
-def should_include_file(file_path, args):
+def compile_filters(args):
+    """
+    Compile the include/exclude arguments once.
+
+    Returns (extension tuple, exclude regex, exclude pattern tuple):
+    str.endswith on a tuple runs in C, and the fnmatch patterns fold
+    into a single compiled alternation instead of one fnmatch call per
+    pattern per file.
+    """
+    ext_tuple = tuple(ext for ext in args.extensions.split(",") if ext)
+    patterns = tuple(p for p in args.exclude.split(",") if p)
+    exclude_re = re.compile("|".join(fnmatch.translate(p) for p in patterns)) if patterns else None
+    return ext_tuple, exclude_re, patterns
+
+
+def should_include_file(file_path, args, filters=None, stat_result=None):
     """Determine if a file should be included in the export."""
+    if filters is None:
+        filters = compile_filters(args)
+    ext_tuple, exclude_re, exclude_patterns = filters
     # Check extension
-    extensions = args.extensions.split(",")
-    if not any(file_path.name.endswith(ext) for ext in extensions):
+    if not file_path.name.endswith(ext_tuple):
         return False
     # Check excluded patterns
-    exclude_patterns = args.exclude.split(",")
-    for pattern in exclude_patterns:
-        if fnmatch.fnmatch(file_path.name, pattern):
-            return False
+    if exclude_re is not None and exclude_re.match(file_path.name):
+        return False
     # Check if file is in excluded directory
-    for pattern in exclude_patterns:
-        if pattern in str(file_path):
-            return False
-    # Check file size
-    if file_path.stat().st_size > args.max_size:
-        print(f"Skipping large file: {file_path} ({file_path.stat().st_size} bytes)")
+    path_str = str(file_path)
+    if any(pattern in path_str for pattern in exclude_patterns):
+        return False
+    # Check file size, reusing the caller's stat when it has one
+    if stat_result is None:
+        stat_result = file_path.stat()
+    if stat_result.st_size > args.max_size:
+        print(f"Skipping large file: {file_path} ({stat_result.st_size} bytes)")
         return False
     return True
 
@@ -129,18 +158,34 @@ def get_file_language(file_path):
 
 
 def scan_directory(root_dir, files_list, args):
-    """Recursively scan directory and collect files to include."""
-    root_path = Path(root_dir)
-    exclude_dirs = [item for item in args.exclude.split(",") if not item.startswith("*")]
-    for path in root_path.rglob("*"):
-        if any(
-            exclude_dir in str(path.relative_to(root_path))
-            for exclude_dir in exclude_dirs
-            if exclude_dir
-        ):
-            continue
-        if path.is_file() and should_include_file(path, args):
-            files_list.append(path)
+    """
+    Recursively scan directory and collect files to include.
+
+    Returns a {path: size} map from the stat results gathered during the
+    scan, so the export phase never re-stats a file for its SIZE line.
+    """
+    filters = compile_filters(args)
+    exclude_dirs = {item for item in args.exclude.split(",") if item and not item.startswith("*")}
+    sizes = {}
+    # os.walk is scandir-based and lets us prune excluded directories
+    # before descending, instead of rglob materialising every path under
+    # node_modules/.git only to filter it afterwards
+    for dirpath, dirnames, filenames in os.walk(root_dir):
+        dirnames[:] = [d for d in dirnames if d not in exclude_dirs]
+        ext_tuple = filters[0]
+        for name in filenames:
+            # Cheap C-level extension gate before paying for a stat
+            if not name.endswith(ext_tuple):
+                continue
+            path = Path(dirpath) / name
+            try:
+                stat_result = path.stat()
+            except OSError:
+                continue
+            if should_include_file(path, args, filters, stat_result):
+                files_list.append(path)
+                sizes[path] = stat_result.st_size
+    return sizes
 
 
 def create_separator(length=80):
@@ -148,13 +193,15 @@ def create_separator(length=80):
     return "=" * length
 
 
-def format_file_header(file_path, root_dir):
-    """Format header for a file."""
+def format_file_header(file_path, root_dir, size=None):
+    """Format header for a file, reusing the scan-time size if provided."""
     rel_path = os.path.relpath(file_path, root_dir)
+    if size is None:
+        size = file_path.stat().st_size
     header = create_separator()
     header += f"\nFILE: {rel_path}\n"
     header += f"LANGUAGE: {get_file_language(file_path)}\n"
-    header += f"SIZE: {file_path.stat().st_size} bytes\n"
+    header += f"SIZE: {size} bytes\n"
     header += create_separator()
     return header
 
@@ -170,41 +217,85 @@ def generate_toc(files_list, root_dir):
     return toc
 
 
-def export_codebase(args):
+async def _read_source(file_path, semaphore):
+    """Read one source file under the concurrency bound."""
+    async with semaphore:
+        async with aiofiles.open(file_path, "r", encoding="utf-8", errors="replace") as f:
+            return await f.read()
+
+
+async def _stream_source(file_path, out_file):
+    """
+    Copy one file into the export through a fixed-size buffer, so large
+    files never hold more than STREAM_CHUNK of content resident.
+    """
+    async with aiofiles.open(file_path, "r", encoding="utf-8", errors="replace") as src:
+        while True:
+            chunk = await src.read(STREAM_CHUNK)
+            if not chunk:
+                break
+            await out_file.write(chunk)
+
+
+async def export_codebase(args):
     """Export codebase files to a single text file."""
     root_dir = os.path.abspath(args.directory)
     output_file = args.output
     files_list = []
     print(f"Scanning directory: {root_dir}")
-    scan_directory(root_dir, files_list, args)
+    sizes = scan_directory(root_dir, files_list, args)
     # Sort files alphabetically
     files_list.sort()
     print(f"Found {len(files_list)} files to export")
-    with open(output_file, "w", encoding="utf-8") as f:
+    # Fan the reads out so disk queue depth stays above 1; the writer
+    # consumes the tasks in file order, so output is unchanged. Large
+    # files are not pre-read: they stream chunk-by-chunk at write time
+    # (line numbering needs whole-file content, so it always pre-reads).
+    # Tasks are started through a sliding window of READ_CONCURRENCY ahead
+    # of the writer, so completed reads never accumulate beyond the window
+    # and the whole tree is never memory-resident at once.
+    semaphore = asyncio.Semaphore(READ_CONCURRENCY)
+
+    def _start_read(path):
+        if not args.include_line_numbers and sizes.get(path, 0) > STREAM_THRESHOLD:
+            return None
+        return asyncio.create_task(_read_source(path, semaphore))
+
+    window = deque(_start_read(path) for path in files_list[:READ_CONCURRENCY])
+    next_index = len(window)
+    async with aiofiles.open(output_file, "w", encoding="utf-8") as f:
         # Write header
         header = args.header.replace(
             "{timestamp}", datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         )
-        f.write(header + "\n\n")
+        await f.write(header + "\n\n")
         # Write table of contents if requested
         if args.toc:
-            f.write(generate_toc(files_list, root_dir))
+            await f.write(generate_toc(files_list, root_dir))
         # Process each file
         for file_path in files_list:
+            read_task = window.popleft()
+            if next_index < len(files_list):
+                window.append(_start_read(files_list[next_index]))
+                next_index += 1
             try:
                 # Write file header
-                f.write(format_file_header(file_path, root_dir) + "\n\n")
-                # Read and write file content with optional line numbers
-                with open(file_path, "r", encoding="utf-8", errors="replace") as source_file:
+                await f.write(format_file_header(file_path, root_dir, sizes.get(file_path)) + "\n\n")
+                # Write file content with optional line numbers
+                if read_task is None:
+                    await _stream_source(file_path, f)
+                else:
+                    content = await read_task
                     if args.include_line_numbers:
-                        for i, line in enumerate(source_file, 1):
-                            f.write(f"{i:4d} | {line}")
-                    else:
-                        f.write(source_file.read())
+                        content = "".join(
+                            f"{i:4d} | {line}"
+                            for i, line in enumerate(content.splitlines(keepends=True), 1)
+                        )
+                    await f.write(content)
                 # Add newlines for spacing
-                f.write("\n\n")
+                await f.write("\n\n")
             except Exception as e:
-                f.write(f"ERROR: Could not read file {file_path}: {str(e)}\n\n")
+                await f.write(f"ERROR: Could not read file {file_path}: {str(e)}\n\n")
     print(f"Export completed successfully to: {output_file}")
     print(f"Total size: {os.path.getsize(output_file)} bytes")
 
@@ -212,7 +303,7 @@ def export_codebase(args):
 def main():
     """Main entry point."""
     args = parse_arguments()
-    export_codebase(args)
+    asyncio.run(export_codebase(args))
 
 
 if __name__ == "__main__":
@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi.openapi.utils import get_openapi
 from app.api import filesystem, memory, git, scraper, documents
 from app.utils.config import get_config
@@ -8,6 +9,7 @@ app = FastAPI(
     title="othertales System Tools",
     version="1.0.0",
     description="A unified server providing filesystem, memory, git, web scraping, and document management tools for LLMs via OpenWebUI.",
+    default_response_class=ORJSONResponse,
 )
 # Configure CORS specifically for Open WebUI compatibility
 origins = [
@@ -74,9 +76,33 @@ async def root():
 
 
 if __name__ == "__main__":
+    import os
     import uvicorn
 
+    # uvloop is not installed on Windows (see requirements.txt marker),
+    # so fall back to uvicorn's defaults when either speedup is missing
+    try:
+        import uvloop  # noqa: F401
+        HAS_UVLOOP = True
+    except ImportError:
+        HAS_UVLOOP = False
+    try:
+        import httptools  # noqa: F401
+        HAS_HTTPTOOLS = True
+    except ImportError:
+        HAS_HTTPTOOLS = False
+
     config = get_config()
+    # One worker per core (or WEB_CONCURRENCY) with the uvloop event loop
+    # and httptools parser in production; dev mode keeps single-worker
+    # reload, which uvicorn cannot combine with workers > 1
+    workers = 1 if config.dev_mode else int(os.getenv("WEB_CONCURRENCY", str(os.cpu_count() or 1)))
     uvicorn.run(
-        "main:app", host=config.server_host, port=config.server_port, reload=config.dev_mode
+        "main:app",
+        host=config.server_host,
+        port=config.server_port,
+        reload=config.dev_mode,
+        workers=workers,
+        loop="uvloop" if HAS_UVLOOP else "auto",
+        http="httptools" if HAS_HTTPTOOLS else "auto",
     )
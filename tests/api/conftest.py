@@ -0,0 +1,46 @@
+import pytest
+from unittest.mock import Mock
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api import filesystem, git
+from app.core.filesystem_service import FilesystemService
+from app.core.git_service import GitService
+
+# One spec'd Mock per service for the whole session: spec restricts
+# attribute access to the real API and skips MagicMock's magic-method
+# machinery; per-test isolation comes from reset_mock below
+_fs_service_mock = Mock(spec=FilesystemService)
+_git_service_mock = Mock(spec=GitService)
+
+
+@pytest.fixture(autouse=True)
+def mock_fs_service(monkeypatch):
+    _fs_service_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("app.api.filesystem.filesystem_service", _fs_service_mock)
+    return _fs_service_mock
+
+
+@pytest.fixture(autouse=True)
+def mock_git_service(monkeypatch):
+    _git_service_mock.reset_mock(return_value=True, side_effect=True)
+    monkeypatch.setattr("app.api.git.git_service", _git_service_mock)
+    return _git_service_mock
+
+
+@pytest.fixture(scope="session")
+def fs_client():
+    # Build the app and client once per session; the context manager
+    # fires startup/shutdown a single time instead of per test
+    app = FastAPI()
+    app.include_router(filesystem.router, prefix="/fs")
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def git_client():
+    app = FastAPI()
+    app.include_router(git.router, prefix="/git")
+    with TestClient(app) as client:
+        yield client
@@ -1,53 +1,36 @@
-import pytest
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
-import os
 import io
 
-from app.api.filesystem import router
-from app.models.filesystem import DirectoryListingResponse
-
-# Create test app
-app = FastAPI()
-app.include_router(router, prefix="/fs")
-client = TestClient(app)
-
-
-class TestFilesystemAPI:
-    @patch("app.api.filesystem.filesystem_service")
-    def test_read_file(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.read_file.return_value = "File content"
-
-        # Send request
-        response = client.post("/fs/read", json={"path": "/test/file.txt", "storage": "local"})
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "File content"
-        mock_fs_service.read_file.assert_called_once()
-
-    @patch("app.api.filesystem.filesystem_service")
-    def test_write_file(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.write_file.return_value = "Successfully wrote to /test/file.txt"
-
-        # Send request
-        response = client.post(
-            "/fs/write",
-            json={"path": "/test/file.txt", "content": "New content", "storage": "local"},
-        )
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "Successfully wrote to /test/file.txt"
-        mock_fs_service.write_file.assert_called_once()
+import orjson
+import pytest
 
-    @patch("app.api.filesystem.filesystem_service")
-    def test_list_directory(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.list_directory.return_value = {
+# Shared upload buffer, rewound and truncated per use so repeated or
+# parametrized upload tests reuse one allocation
+_UPLOAD_BUF = io.BytesIO()
+
+
+# (endpoint, payload, service method, mocked return, response check)
+_FS_CASES = [
+    pytest.param(
+        "/fs/read",
+        {"path": "/test/file.txt", "storage": "local"},
+        "read_file",
+        "File content",
+        lambda r: r.text == "File content",
+        id="read",
+    ),
+    pytest.param(
+        "/fs/write",
+        {"path": "/test/file.txt", "content": "New content", "storage": "local"},
+        "write_file",
+        "Successfully wrote to /test/file.txt",
+        lambda r: r.text == "Successfully wrote to /test/file.txt",
+        id="write",
+    ),
+    pytest.param(
+        "/fs/list",
+        {"path": "/test", "storage": "local", "recursive": False},
+        "list_directory",
+        {
             "path": "/test",
             "items": [
                 {
@@ -65,75 +48,109 @@ class TestFilesystemAPI:
                     "last_modified": None,
                 },
             ],
-        }
-
-        # Send request
-        response = client.post(
-            "/fs/list", json={"path": "/test", "storage": "local", "recursive": False}
+        },
+        lambda r: r.json()["path"] == "/test"
+        and len(r.json()["items"]) == 2
+        and r.json()["items"][0]["name"] == "file1.txt",
+        id="list",
+    ),
+    pytest.param(
+        "/fs/search",
+        {"path": "/test", "pattern": "*.txt", "storage": "local"},
+        "search_files",
+        ["/test/file1.txt", "/test/subdir/file2.txt"],
+        lambda r: len(r.json()) == 2 and "/test/file1.txt" in r.json(),
+        id="search",
+    ),
+    pytest.param(
+        "/fs/mkdir",
+        {"path": "/test/newdir", "storage": "local"},
+        "create_directory",
+        "Successfully created directory /test/newdir",
+        lambda r: r.text == "Successfully created directory /test/newdir",
+        id="mkdir",
+    ),
+    pytest.param(
+        "/fs/delete",
+        {"path": "/test/file.txt", "storage": "local"},
+        "delete_file",
+        "Successfully deleted /test/file.txt",
+        lambda r: r.text == "Successfully deleted /test/file.txt",
+        id="delete",
+    ),
+    pytest.param(
+        "/fs/read-binary",
+        {"path": "/test/binary.bin", "storage": "local"},
+        "read_file_binary",
+        b"Binary content",
+        lambda r: r.content == b"Binary content",
+        id="read-binary",
+    ),
+    pytest.param(
+        "/fs/exists",
+        {"path": "/test/file.txt", "storage": "local"},
+        "file_exists",
+        True,
+        lambda r: r.json() is True,
+        id="exists",
+    ),
+]
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _encode_payloads(cases):
+    # Serialize each case's JSON body once at import time so TestClient
+    # does not re-run json.dumps on every request
+    return [
+        pytest.param(
+            case.values[0],
+            orjson.dumps(case.values[1]),
+            *case.values[2:],
+            id=case.id,
         )
+        for case in cases
+    ]
 
-        # Verify response
-        assert response.status_code == 200
-        assert response.json()["path"] == "/test"
-        assert len(response.json()["items"]) == 2
-        assert response.json()["items"][0]["name"] == "file1.txt"
-        mock_fs_service.list_directory.assert_called_once()
 
-    @patch("app.api.filesystem.filesystem_service")
-    def test_search_files(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.search_files.return_value = ["/test/file1.txt", "/test/subdir/file2.txt"]
+FS_ENDPOINT_CASES = _encode_payloads(_FS_CASES)
 
-        # Send request
-        response = client.post(
-            "/fs/search", json={"path": "/test", "pattern": "*.txt", "storage": "local"}
-        )
 
-        # Verify response
-        assert response.status_code == 200
-        assert len(response.json()) == 2
-        assert "/test/file1.txt" in response.json()
-        mock_fs_service.search_files.assert_called_once()
-
-    @patch("app.api.filesystem.filesystem_service")
-    def test_create_directory(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.create_directory.return_value = (
-            "Successfully created directory /test/newdir"
-        )
-
-        # Send request
-        response = client.post("/fs/mkdir", json={"path": "/test/newdir", "storage": "local"})
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "Successfully created directory /test/newdir"
-        mock_fs_service.create_directory.assert_called_once()
-
-    @patch("app.api.filesystem.filesystem_service")
-    def test_delete_file(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.delete_file.return_value = "Successfully deleted /test/file.txt"
-
-        # Send request
-        response = client.post("/fs/delete", json={"path": "/test/file.txt", "storage": "local"})
+class TestFilesystemAPI:
+    @pytest.mark.parametrize(
+        "endpoint,payload,service_method,mock_return,check", FS_ENDPOINT_CASES
+    )
+    def test_fs_endpoint(
+        self, mock_fs_service, fs_client, endpoint, payload, service_method, mock_return, check
+    ):
+        # Every JSON filesystem endpoint follows the same shape: stub the
+        # service method, POST JSON, assert status + body, one service call
+        getattr(mock_fs_service, service_method).return_value = mock_return
+
+        response = fs_client.post(endpoint, content=payload, headers=_JSON_HEADERS)
 
-        # Verify response
         assert response.status_code == 200
-        assert response.text == "Successfully deleted /test/file.txt"
-        mock_fs_service.delete_file.assert_called_once()
-
-    @patch("app.api.filesystem.filesystem_service")
-    def test_upload_file(self, mock_fs_service):
-        # Mock the service
+        assert check(response)
+        # Plain integer check: skips MagicMock's assertion and error
+        # message machinery that runs even on success
+        assert getattr(mock_fs_service, service_method).call_count == 1
+
+    def test_upload_file(self, mock_fs_service, fs_client):
+        # Multipart upload has a different call shape, so it stays a
+        # standalone test
         mock_fs_service.write_file_binary.return_value = "Successfully wrote to /test/uploaded.txt"
         mock_fs_service.invalidate_cache.return_value = None
 
-        # Create test file
-        test_file = io.BytesIO(b"Test file content")
+        # Refill the shared buffer with this test's payload
+        _UPLOAD_BUF.seek(0)
+        _UPLOAD_BUF.truncate()
+        _UPLOAD_BUF.write(b"Test file content")
+        _UPLOAD_BUF.seek(0)
+        test_file = _UPLOAD_BUF
 
         # Send request
-        response = client.post(
+        response = fs_client.post(
             "/fs/upload",
             files={"file": ("uploaded.txt", test_file)},
             data={"path": "/test", "storage": "local"},
@@ -143,31 +160,3 @@ class TestFilesystemAPI:
         assert response.status_code == 200
         assert "Successfully wrote to" in response.text
         mock_fs_service.write_file_binary.assert_called_once()
-
-    @patch("app.api.filesystem.filesystem_service")
-    def test_read_binary_file(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.read_file_binary.return_value = b"Binary content"
-
-        # Send request
-        response = client.post(
-            "/fs/read-binary", json={"path": "/test/binary.bin", "storage": "local"}
-        )
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.content == b"Binary content"
-        mock_fs_service.read_file_binary.assert_called_once()
-
-    @patch("app.api.filesystem.filesystem_service")
-    def test_file_exists(self, mock_fs_service):
-        # Mock the service
-        mock_fs_service.file_exists.return_value = True
-
-        # Send request
-        response = client.post("/fs/exists", json={"path": "/test/file.txt", "storage": "local"})
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.json() is True
-        mock_fs_service.file_exists.assert_called_once()
@@ -1,105 +1,59 @@
+import orjson
 import pytest
-from unittest.mock import patch, MagicMock
-from fastapi.testclient import TestClient
-from fastapi import FastAPI
 
-from app.api.git import router
 
-# Create test app
-app = FastAPI()
-app.include_router(router, prefix="/git")
-client = TestClient(app)
-
-
-class TestGitAPI:
-    @patch("app.api.git.git_service")
-    def test_get_status(self, mock_git_service):
-        # Mock the service
-        mock_git_service.get_status.return_value = {
-            "branch": "main",
-            "clean": True,
-            "untracked": [],
-            "modified": [],
-            "staged": [],
-        }
-
-        # Send request
-        response = client.post("/git/status", json={"repo_path": "/test/repo"})
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.json()["branch"] == "main"
-        assert response.json()["clean"] is True
-        mock_git_service.get_status.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_get_diff(self, mock_git_service):
-        # Mock the service
-        mock_git_service.get_diff.return_value = "diff --git a/file.txt b/file.txt\n+New content"
-
-        # Send request
-        response = client.post(
-            "/git/diff", json={"repo_path": "/test/repo", "file_path": "file.txt"}
-        )
-
-        # Verify response
-        assert response.status_code == 200
-        assert "diff --git" in response.text
-        mock_git_service.get_diff.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_add_files(self, mock_git_service):
-        # Mock the service
-        mock_git_service.add_files.return_value = "Files staged successfully"
-
-        # Send request
-        response = client.post(
-            "/git/add", json={"repo_path": "/test/repo", "files": ["file1.txt", "file2.txt"]}
-        )
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "Files staged successfully"
-        mock_git_service.add_files.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_commit_changes(self, mock_git_service):
-        # Mock the service
-        mock_git_service.commit_changes.return_value = "Committed changes with hash abc123"
-
-        # Send request
-        response = client.post(
-            "/git/commit",
-            json={
-                "repo_path": "/test/repo",
-                "message": "Test commit",
-                "author_name": "Test User",
-                "author_email": "test@example.com",
-            },
-        )
-
-        # Verify response
-        assert response.status_code == 200
-        assert "Committed changes with hash" in response.text
-        mock_git_service.commit_changes.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_reset_changes(self, mock_git_service):
-        # Mock the service
-        mock_git_service.reset_changes.return_value = "All staged changes reset"
-
-        # Send request
-        response = client.post("/git/reset", json={"repo_path": "/test/repo"})
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "All staged changes reset"
-        mock_git_service.reset_changes.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_get_log(self, mock_git_service):
-        # Mock the service
-        mock_git_service.get_log.return_value = {
+# (endpoint, payload, service method, mocked return, response check)
+_GIT_CASES = [
+    pytest.param(
+        "/git/status",
+        {"repo_path": "/test/repo"},
+        "get_status",
+        {"branch": "main", "clean": True, "untracked": [], "modified": [], "staged": []},
+        lambda r: r.json()["branch"] == "main" and r.json()["clean"] is True,
+        id="status",
+    ),
+    pytest.param(
+        "/git/diff",
+        {"repo_path": "/test/repo", "file_path": "file.txt"},
+        "get_diff",
+        "diff --git a/file.txt b/file.txt\n+New content",
+        lambda r: "diff --git" in r.text,
+        id="diff",
+    ),
+    pytest.param(
+        "/git/add",
+        {"repo_path": "/test/repo", "files": ["file1.txt", "file2.txt"]},
+        "add_files",
+        "Files staged successfully",
+        lambda r: r.text == "Files staged successfully",
+        id="add",
+    ),
+    pytest.param(
+        "/git/commit",
+        {
+            "repo_path": "/test/repo",
+            "message": "Test commit",
+            "author_name": "Test User",
+            "author_email": "test@example.com",
+        },
+        "commit_changes",
+        "Committed changes with hash abc123",
+        lambda r: "Committed changes with hash" in r.text,
+        id="commit",
+    ),
+    pytest.param(
+        "/git/reset",
+        {"repo_path": "/test/repo"},
+        "reset_changes",
+        "All staged changes reset",
+        lambda r: r.text == "All staged changes reset",
+        id="reset",
+    ),
+    pytest.param(
+        "/git/log",
+        {"repo_path": "/test/repo", "max_count": 10},
+        "get_log",
+        {
             "commits": [
                 {
                     "hash": "abc123",
@@ -108,82 +62,84 @@ class TestGitAPI:
                     "date": "2023-01-01 10:00:00",
                 }
             ]
-        }
-
-        # Send request
-        response = client.post("/git/log", json={"repo_path": "/test/repo", "max_count": 10})
-
-        # Verify response
-        assert response.status_code == 200
-        assert len(response.json()["commits"]) == 1
-        assert response.json()["commits"][0]["hash"] == "abc123"
-        mock_git_service.get_log.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_create_branch(self, mock_git_service):
-        # Mock the service
-        mock_git_service.create_branch.return_value = "Created branch 'feature'"
-
-        # Send request
-        response = client.post(
-            "/git/branch",
-            json={"repo_path": "/test/repo", "branch_name": "feature", "base_branch": "main"},
+        },
+        lambda r: len(r.json()["commits"]) == 1 and r.json()["commits"][0]["hash"] == "abc123",
+        id="log",
+    ),
+    pytest.param(
+        "/git/branch",
+        {"repo_path": "/test/repo", "branch_name": "feature", "base_branch": "main"},
+        "create_branch",
+        "Created branch 'feature'",
+        lambda r: r.text == "Created branch 'feature'",
+        id="branch",
+    ),
+    pytest.param(
+        "/git/checkout",
+        {"repo_path": "/test/repo", "branch_name": "feature", "create": False},
+        "checkout_branch",
+        "Switched to branch 'feature'",
+        lambda r: r.text == "Switched to branch 'feature'",
+        id="checkout",
+    ),
+    pytest.param(
+        "/git/clone",
+        {"repo_url": "https://github.com/example/repo.git", "local_path": "/test/cloned"},
+        "clone_repo",
+        "Cloned repository to '/test/cloned'",
+        lambda r: r.text == "Cloned repository to '/test/cloned'",
+        id="clone",
+    ),
+    pytest.param(
+        "/git/batch-commit",
+        {
+            "repo_path": "/test/repo",
+            "file_groups": [["file1.txt", "file2.txt"], ["file3.txt"]],
+            "message_template": "Batch commit",
+        },
+        "batch_commit",
+        ["abc123", "def456"],
+        lambda r: len(r.json()) == 2 and r.json()[0] == "abc123",
+        id="batch-commit",
+    ),
+]
+
+
+_JSON_HEADERS = {"content-type": "application/json"}
+
+
+def _encode_payloads(cases):
+    # Serialize each case's JSON body once at import time so TestClient
+    # does not re-run json.dumps on every request
+    return [
+        pytest.param(
+            case.values[0],
+            orjson.dumps(case.values[1]),
+            *case.values[2:],
+            id=case.id,
         )
+        for case in cases
+    ]
 
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "Created branch 'feature'"
-        mock_git_service.create_branch.assert_called_once()
 
-    @patch("app.api.git.git_service")
-    def test_checkout_branch(self, mock_git_service):
-        # Mock the service
-        mock_git_service.checkout_branch.return_value = "Switched to branch 'feature'"
+GIT_ENDPOINT_CASES = _encode_payloads(_GIT_CASES)
 
-        # Send request
-        response = client.post(
-            "/git/checkout",
-            json={"repo_path": "/test/repo", "branch_name": "feature", "create": False},
-        )
 
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "Switched to branch 'feature'"
-        mock_git_service.checkout_branch.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_clone_repo(self, mock_git_service):
-        # Mock the service
-        mock_git_service.clone_repo.return_value = "Cloned repository to '/test/cloned'"
-
-        # Send request
-        response = client.post(
-            "/git/clone",
-            json={"repo_url": "https://github.com/example/repo.git", "local_path": "/test/cloned"},
-        )
-
-        # Verify response
-        assert response.status_code == 200
-        assert response.text == "Cloned repository to '/test/cloned'"
-        mock_git_service.clone_repo.assert_called_once()
-
-    @patch("app.api.git.git_service")
-    def test_batch_commit(self, mock_git_service):
-        # Mock the service
-        mock_git_service.batch_commit.return_value = ["abc123", "def456"]
-
-        # Send request
-        response = client.post(
-            "/git/batch-commit",
-            json={
-                "repo_path": "/test/repo",
-                "file_groups": [["file1.txt", "file2.txt"], ["file3.txt"]],
-                "message_template": "Batch commit",
-            },
-        )
+class TestGitAPI:
+    @pytest.mark.parametrize(
+        "endpoint,payload,service_method,mock_return,check", GIT_ENDPOINT_CASES
+    )
+    def test_git_endpoint(
+        self, mock_git_service, git_client, endpoint, payload, service_method, mock_return, check
+    ):
+        # Every git endpoint follows the same shape: stub the service
+        # method, POST JSON, assert status + body, one service call
+        getattr(mock_git_service, service_method).return_value = mock_return
+
+        response = git_client.post(endpoint, content=payload, headers=_JSON_HEADERS)
 
-        # Verify response
         assert response.status_code == 200
-        assert len(response.json()) == 2
-        assert response.json()[0] == "abc123"
-        mock_git_service.batch_commit.assert_called_once()
+        assert check(response)
+        # Plain integer check: skips MagicMock's assertion and error
+        # message machinery that runs even on success
+        assert getattr(mock_git_service, service_method).call_count == 1
@@ -0,0 +1,31 @@
+"""
+Stub the heavyweight optional dependencies before any service module is
+imported. sentence_transformers pulls in PyTorch/transformers at import
+time and weasyprint loads Cairo/Pango; neither is exercised for real by
+these tests, so fakes go into sys.modules at collection time and every
+lazy `from sentence_transformers import SentenceTransformer` inside the
+services resolves to a mock instead.
+
+This lives at the tests root because tests/api is collected before
+tests/core and imports the service modules; the stubs must be in place
+before that first import binds the real packages.
+"""
+import sys
+import types
+from unittest.mock import MagicMock
+
+import numpy as np
+
+_sentence_transformers = types.ModuleType("sentence_transformers")
+_sentence_transformers.SentenceTransformer = MagicMock(
+    return_value=MagicMock(encode=MagicMock(return_value=np.zeros((1, 384))))
+)
+sys.modules.setdefault("sentence_transformers", _sentence_transformers)
+
+_weasyprint = types.ModuleType("weasyprint")
+_weasyprint.HTML = MagicMock()
+sys.modules.setdefault("weasyprint", _weasyprint)
+
+# boto3 drags in botocore/jmespath/urllib3 on import and only the S3
+# test touches it, always through mocks
+sys.modules.setdefault("boto3", MagicMock())
@@ -0,0 +1,25 @@
+"""
+Shared fixtures for the core service tests. The optional-dependency
+stubs (sentence_transformers, weasyprint, boto3) live in the top-level
+tests/conftest.py so they apply before tests/api imports the service
+modules.
+"""
+import os
+
+import pytest
+
+
+@pytest.fixture(scope="session")
+def seed_files():
+    """Write small fixture files through raw fds, skipping the
+    TextIOWrapper buffering/flush layer per file."""
+
+    def _seed(base, pairs):
+        for name, content in pairs:
+            fd = os.open(os.path.join(base, name), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                os.write(fd, content.encode())
+            finally:
+                os.close(fd)
+
+    return _seed
@@ -1,5 +1,7 @@
+import contextlib
 import shutil
-import tempfile
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -10,36 +12,102 @@ from app.core.documents_service import DocumentsService
 from app.models.documents import DocumentType
 
 
-@pytest.fixture
-def docs_test_dir():
-    # Create a temporary directory for testing
-    temp_dir_path = tempfile.mkdtemp()
-    yield temp_dir_path
-    # Cleanup
-    shutil.rmtree(temp_dir_path)
+@pytest.fixture(scope="session")
+def docs_template_dir(tmp_path_factory, _patched_docs_deps):
+    # Build the on-disk skeleton (doc-type directories, README, index
+    # dirs) once; per-test fixtures copy it instead of re-creating it
+    template = tmp_path_factory.mktemp("docs_template")
+    DocumentsService(base_path=str(template))
+    return template
 
 
 @pytest.fixture
-def docs_service_fixture(docs_test_dir):
-    # Mock dependencies
-    with (
-        patch("app.core.documents_service.get_config"),
-        patch("app.core.documents_service.GitService") as mock_git_service,
-        patch("app.core.documents_service.SentenceTransformer") as mock_transformer,
-    ):
-        # Set up GitService mock
-        git_service_instance = MagicMock()
-        mock_git_service.return_value = git_service_instance
-        
-        # Set up SentenceTransformer mock to avoid Hugging Face API calls
+def docs_test_dir(tmp_path, docs_template_dir):
+    # tmp_path is unique per test and per xdist worker, so parallel
+    # workers never collide on disk and pytest handles cleanup. The
+    # reflink copy is near-free on btrfs/XFS; elsewhere cp/copytree
+    # still beats rebuilding the skeleton through the service
+    test_dir = tmp_path / "docs"
+    if sys.platform.startswith("linux"):
+        result = subprocess.run(
+            ["cp", "--reflink=auto", "-r", str(docs_template_dir), str(test_dir)],
+            check=False,
+        )
+        if result.returncode == 0:
+            return str(test_dir)
+    shutil.copytree(docs_template_dir, test_dir)
+    return str(test_dir)
+
+
+@pytest.fixture(scope="session")
+def _patched_docs_deps():
+    # Enter the three patches once per session instead of per test; the
+    # SentenceTransformer mock avoids Hugging Face API calls and reuses
+    # a single zero embedding of the standard size
+    embedding = np.zeros((1, 384))
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch("app.core.documents_service.get_config"))
+        mock_git_service = stack.enter_context(
+            patch("app.core.documents_service.GitService")
+        )
+        mock_transformer = stack.enter_context(
+            patch("app.core.documents_service.SentenceTransformer")
+        )
         transformer_instance = MagicMock()
-        # Mock the encode method which will be used to generate embeddings
-        transformer_instance.encode.return_value = np.zeros((1, 384))  # Use a standard embedding size
+        transformer_instance.encode.return_value = embedding
         mock_transformer.return_value = transformer_instance
+        yield mock_git_service, mock_transformer
+
+
+@pytest.fixture
+def docs_service_fixture(_patched_docs_deps, docs_test_dir):
+    mock_git_service, _ = _patched_docs_deps
+    # Fresh GitService instance mock per test so recorded calls and
+    # configured return values never leak between tests
+    mock_git_service.return_value = MagicMock()
+    return DocumentsService(base_path=docs_test_dir)
 
-        # Configure service
-        service = DocumentsService(base_path=docs_test_dir)
-        yield service
+
+@pytest.fixture(scope="module")
+def seeded_docs_service(_patched_docs_deps, tmp_path_factory):
+    # One service with a canonical document set, shared by the read-only
+    # tests so each of them does not pay for its own create_document
+    # round of file I/O + indexing. Destructive tests stay on the
+    # per-test docs_service_fixture.
+    mock_git_service, _ = _patched_docs_deps
+    mock_git_service.return_value = MagicMock()
+    service = DocumentsService(base_path=str(tmp_path_factory.mktemp("docs_seeded")))
+    docs = {
+        "get": service.create_document(
+            title="Get Test",
+            content="Content for retrieval test",
+            document_type=DocumentType.GENERIC,
+        ),
+        "search_one": service.create_document(
+            title="Search Test One",
+            content="This document has specific content to find.",
+            document_type=DocumentType.GENERIC,
+            tags=["search", "test"],
+        ),
+        "search_two": service.create_document(
+            title="Search Test Two",
+            content="Another document with different content.",
+            document_type=DocumentType.GENERIC,
+            tags=["search", "different"],
+        ),
+        "webpage": service.create_document(
+            title="Different Type",
+            content="This has a different document type.",
+            document_type=DocumentType.WEBPAGE,
+            tags=["webpage"],
+        ),
+        "versions": service.create_document(
+            title="Version Test",
+            content="Initial version",
+            document_type=DocumentType.GENERIC,
+        ),
+    }
+    return service, docs
 
 
 class TestDocumentsService:
@@ -71,16 +139,13 @@ class TestDocumentsService:
         assert "Test Document" in content
         assert "This is test content." in content
 
-    def test_get_document(self, docs_service_fixture):
-        # Create a document
-        doc = docs_service_fixture.create_document(
-            title="Get Test",
-            content="Content for retrieval test",
-            document_type=DocumentType.GENERIC,
-        )
+    def test_get_document(self, seeded_docs_service):
+        # Use the pre-seeded document
+        service, docs = seeded_docs_service
+        doc = docs["get"]
 
         # Get the document
-        retrieved = docs_service_fixture.get_document(doc["id"])
+        retrieved = service.get_document(doc["id"])
 
         # Verify retrieval
         assert retrieved["id"] == doc["id"]
@@ -133,64 +198,31 @@ class TestDocumentsService:
         )
         assert not doc_path.exists()
 
-    def test_search_documents(self, docs_service_fixture):
-        # Create test documents
-        docs = []
-        
-        # Document 1
-        docs.append(
-            docs_service_fixture.create_document(
-                title="Search Test One",
-                content="This document has specific content to find.",
-                document_type=DocumentType.GENERIC,
-                tags=["search", "test"],
-            )
-        )
-        
-        # Document 2
-        docs.append(
-            docs_service_fixture.create_document(
-                title="Search Test Two",
-                content="Another document with different content.",
-                document_type=DocumentType.GENERIC,
-                tags=["search", "different"],
-            )
-        )
-        
-        # Document 3 (with different type)
-        docs.append(
-            docs_service_fixture.create_document(
-                title="Different Type",
-                content="This has a different document type.",
-                document_type=DocumentType.WEBPAGE,
-                tags=["webpage"],
-            )
-        )
+    def test_search_documents(self, seeded_docs_service):
+        # The canonical search documents are seeded once per module
+        service, docs = seeded_docs_service
 
         # Search by content
-        results = docs_service_fixture.search_documents("specific content")
+        results = service.search_documents("specific content")
         assert len(results) == 1
-        assert results[0]["id"] == docs[0]["id"]
-        
+        assert results[0]["id"] == docs["search_one"]["id"]
+
         # Search by tag
-        results = docs_service_fixture.search_documents("", tags=["search"])
+        results = service.search_documents("", tags=["search"])
         assert len(results) == 2
-        
+
         # Search by document type
-        results = docs_service_fixture.search_documents("", doc_type=DocumentType.WEBPAGE.value)
+        results = service.search_documents("", doc_type=DocumentType.WEBPAGE.value)
         assert len(results) == 1
-        assert results[0]["id"] == docs[2]["id"]
+        assert results[0]["id"] == docs["webpage"]["id"]
 
-    def test_get_document_versions(self, docs_service_fixture):
-        # Create a document
-        doc = docs_service_fixture.create_document(
-            title="Version Test", 
-            content="Initial version", 
-            document_type=DocumentType.GENERIC
-        )
+    def test_get_document_versions(self, seeded_docs_service):
+        # Use the pre-seeded document
+        service, docs = seeded_docs_service
+        doc = docs["versions"]
 
         # Mock git log response
-        docs_service_fixture.git_service.get_log.return_value = {
+        service.git_service.get_log.return_value = {
             "commits": [
                 {
                     "hash": "abc123",
@@ -208,7 +240,7 @@ class TestDocumentsService:
         }
 
         # Get document versions
-        versions = docs_service_fixture.get_document_versions(doc["id"])
+        versions = service.get_document_versions(doc["id"])
 
         # Verify versions
         assert len(versions) == 2
@@ -1,6 +1,5 @@
+import contextlib
 import os
-import shutil
-import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
@@ -9,25 +8,29 @@ import pytest
 from app.core.filesystem_service import FilesystemService
 
 
-@pytest.fixture
-def fs_test_dir():
-    # Create a temporary directory for testing
-    temp_dir_path = tempfile.mkdtemp()
-    yield temp_dir_path
-    # Cleanup
-    shutil.rmtree(temp_dir_path)
-
-
-@pytest.fixture
-def fs_service_fixture(fs_test_dir):
-    # Configure service with test paths
-    with patch("app.core.filesystem_service.get_config") as mock_config:
-        mock_config.return_value.allowed_directories = [fs_test_dir]
+@pytest.fixture(scope="session")
+def fs_service_fixture(tmp_path_factory):
+    # Patch the config and build the service once per session; tests
+    # isolate through per-test subdirectories rather than paying for a
+    # fresh patch + FilesystemService per test
+    session_root = tmp_path_factory.mktemp("fs_root")
+    with contextlib.ExitStack() as stack:
+        mock_config = stack.enter_context(patch("app.core.filesystem_service.get_config"))
+        mock_config.return_value.allowed_directories = [str(session_root)]
         mock_config.return_value.file_cache_enabled = False
         mock_config.return_value.s3_access_key = None
         mock_config.return_value.s3_secret_key = None
-        service = FilesystemService()
-        yield service
+        yield FilesystemService()
+
+
+@pytest.fixture
+def fs_test_dir(fs_service_fixture, tmp_path):
+    # Per-test working directory, allowed for the duration of the test
+    case_dir = tmp_path / "case"
+    case_dir.mkdir()
+    fs_service_fixture.allowed_directories.append(str(case_dir.resolve()))
+    yield str(case_dir)
+    fs_service_fixture.allowed_directories.pop()
 
 
 class TestFilesystemService:
@@ -50,19 +53,15 @@ class TestFilesystemService:
         read_content = fs_service_fixture.read_file(test_path)
         assert read_content == content
 
-    def test_list_directory(self, fs_service_fixture, fs_test_dir):
+    def test_list_directory(self, fs_service_fixture, fs_test_dir, seed_files):
         # Test directory listing
         # First create some test files
         os.makedirs(os.path.join(fs_test_dir, "subdir"), exist_ok=True)
-        
-        test_file1 = os.path.join(fs_test_dir, "file1.txt")
-        test_file2 = os.path.join(fs_test_dir, "file2.txt")
-        
-        with open(test_file1, "w", encoding="utf-8") as f:
-            f.write("File 1 content")
-        
-        with open(test_file2, "w", encoding="utf-8") as f:
-            f.write("File 2 content")
+
+        seed_files(
+            fs_test_dir,
+            [("file1.txt", "File 1 content"), ("file2.txt", "File 2 content")],
+        )
 
         # List directory
         result = fs_service_fixture.list_directory(fs_test_dir)
@@ -92,25 +91,25 @@ class TestFilesystemService:
         assert "Successfully deleted" in delete_result
         assert not os.path.exists(new_dir)
 
-    def test_search_files(self, fs_service_fixture, fs_test_dir):
+    def test_search_files(self, fs_service_fixture, fs_test_dir, seed_files):
         # Test searching for files
         # Create test files with specific patterns
         test_dir1 = os.path.join(fs_test_dir, "search_test")
         os.makedirs(test_dir1, exist_ok=True)
-        
+
         test_file1 = os.path.join(test_dir1, "search_file1.txt")
         test_file2 = os.path.join(test_dir1, "search_file2.txt")
         test_file3 = os.path.join(test_dir1, "other_file.txt")
-        
-        with open(test_file1, "w", encoding="utf-8") as f:
-            f.write("Search file 1")
-        
-        with open(test_file2, "w", encoding="utf-8") as f:
-            f.write("Search file 2")
-        
-        with open(test_file3, "w", encoding="utf-8") as f:
-            f.write("Other file")
-        
+
+        seed_files(
+            test_dir1,
+            [
+                ("search_file1.txt", "Search file 1"),
+                ("search_file2.txt", "Search file 2"),
+                ("other_file.txt", "Other file"),
+            ],
+        )
+
         # Search for files
         result = fs_service_fixture.search_files(fs_test_dir, "search_file*.txt")
         
@@ -121,17 +120,20 @@ class TestFilesystemService:
         assert os.path.basename(test_file2) in str(file_paths)
         assert os.path.basename(test_file3) not in str(file_paths)
 
-    @patch("app.core.filesystem_service.boto3")
-    def test_s3_operations(self, mock_boto3):
+    def test_s3_operations(self):
         # Test S3 operations
         # This test mocks S3 interactions
-        
-        # Mock S3 client and resource
+
+        # boto3 is already a MagicMock installed by conftest before the
+        # service module imported, so no patch round trip is needed
+        import app.core.filesystem_service as fs_mod
+
         mock_s3_client = MagicMock()
         mock_s3_resource = MagicMock()
-        mock_boto3.client.return_value = mock_s3_client
-        mock_boto3.resource.return_value = mock_s3_resource
-        
+        fs_mod.boto3.reset_mock(return_value=True, side_effect=True)
+        fs_mod.boto3.client.return_value = mock_s3_client
+        fs_mod.boto3.resource.return_value = mock_s3_resource
+
         # Create a service with S3 enabled
         with patch("app.core.filesystem_service.get_config") as mock_config:
             mock_config.return_value.allowed_directories = ["/test"]
@@ -1,6 +1,5 @@
 import os
 import shutil
-import tempfile
 from unittest.mock import patch
 
 import pytest
@@ -10,40 +9,55 @@ from app.core.git_service import GitService
 
 
 @pytest.fixture
-def git_temp_directory():
-    # Create a temporary directory for testing
-    temp_dir_path = tempfile.mkdtemp()
-    yield temp_dir_path
-    # Cleanup
-    shutil.rmtree(temp_dir_path)
+def git_temp_directory(tmp_path):
+    # tmp_path is unique per test and per xdist worker; pytest's
+    # retention policy handles cleanup without a synchronous rmtree
+    return str(tmp_path)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def git_service_fixture():
-    service = GitService()
-    yield service
+    # GitService keeps no repo-path state, so one instance serves the
+    # whole session
+    return GitService()
 
 
-@pytest.fixture
-def git_repo_path(git_temp_directory):
-    # Initialize a Git repository for testing
-    repo_path = os.path.join(git_temp_directory, "test_repo")
+@pytest.fixture(scope="session")
+def _git_template(tmp_path_factory):
+    # Run the git plumbing (init, config, initial commit) exactly once;
+    # copying the resulting directory per test is an order of magnitude
+    # cheaper than forking git for every fixture
+    repo_path = str(tmp_path_factory.mktemp("git_template") / "test_repo")
     os.makedirs(repo_path)
-
-    # Initialize git repo
     Repo.init(repo_path)
 
-    # Create a test file and commit it
     test_file = os.path.join(repo_path, "test.txt")
     with open(test_file, "w", encoding="utf-8") as f:
         f.write("Initial content")
 
+    # Pure-Python index/config APIs: no `git` subprocess per call
     repo = Repo(repo_path)
-    repo.git.add("test.txt")
-    repo.git.config("user.email", "test@example.com")
-    repo.git.config("user.name", "Test User")
-    repo.git.commit("-m", "Initial commit")
+    with repo.config_writer() as cw:
+        cw.set_value("user", "email", "test@example.com")
+        cw.set_value("user", "name", "Test User")
+    repo.index.add(["test.txt"])
+    repo.index.commit("Initial commit")
+    return repo_path
+
+
+@pytest.fixture(scope="session")
+def _git_bare_template(tmp_path_factory):
+    # Plain init'd repo without commits, for the webhook test
+    repo_path = str(tmp_path_factory.mktemp("git_bare_template") / "webhook_test_repo")
+    os.makedirs(repo_path)
+    Repo.init(repo_path)
+    return repo_path
 
+
+@pytest.fixture
+def git_repo_path(_git_template, tmp_path):
+    repo_path = str(tmp_path / "test_repo")
+    shutil.copytree(_git_template, repo_path, symlinks=True)
     yield repo_path
 
 
@@ -134,14 +148,12 @@ class TestGitService:
         assert str(tags[0]) == "v1.0"
 
     @patch("app.core.git_service.requests")
-    def test_webhook(self, mock_requests, git_service_fixture, git_temp_directory):
+    def test_webhook(self, mock_requests, git_service_fixture, git_temp_directory, _git_bare_template):
         # Test webhook functionality
-        # Set up a repo
+        # Set up a repo from the session template
         repo_path = os.path.join(git_temp_directory, "webhook_test_repo")
-        os.makedirs(repo_path)
-        
-        Repo.init(repo_path)
-        
+        shutil.copytree(_git_bare_template, repo_path, symlinks=True)
+
         # Mock webhook response
         mock_response = mock_requests.post.return_value
         mock_response.status_code = 200
@@ -1,5 +1,5 @@
-import shutil
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch
 
 import pytest
@@ -9,25 +9,47 @@ import pytest
 from app.core.memory_service import MemoryService
 
 
-@pytest.fixture
-def memory_test_dir():
-    # Create a temporary directory for testing
-    temp_dir_path = Path("./test_data")
-    temp_dir_path.mkdir(exist_ok=True)
-    yield temp_dir_path
-    # Cleanup
-    shutil.rmtree(temp_dir_path)
+@pytest.fixture(autouse=True, scope="module")
+def _no_graph_db():
+    # One plain setattr instead of mock.patch's attribute machinery.
+    # Module scope so it is applied before the class-scoped
+    # populated_memory fixture constructs its service.
+    mp = pytest.MonkeyPatch()
+    mp.setattr(
+        "app.core.memory_service.get_config",
+        lambda: SimpleNamespace(use_graph_db=False),
+    )
+    yield
+    mp.undo()
 
 
 @pytest.fixture
-def memory_service_fixture(memory_test_dir):
-    # Create a memory service with test file
-    memory_file = memory_test_dir / "test_memory.json"
-
-    with patch("app.core.memory_service.get_config") as mock_config:
-        mock_config.return_value.use_graph_db = False
-        service = MemoryService(str(memory_file))
-        yield service
+def memory_service_fixture():
+    # The tests exercise graph semantics, not durability: ':memory:' keeps
+    # every save/load in process-local buffers with no disk writes
+    return MemoryService(":memory:")
+
+
+@pytest.fixture(scope="class")
+def populated_memory():
+    # Shared service for the read-only query tests: the common entity set
+    # is written once per class instead of per test. Relation setup stays
+    # inside the tests — create_relations is part of what they exercise.
+    # The mutating delete tests keep their own per-test service because
+    # their assertions count the whole graph.
+    service = MemoryService(":memory:")
+    service.create_entities(
+        [
+            {"name": "Alice", "entity_type": "person", "properties": {"age": 25}},
+            {"name": "Bob", "entity_type": "person", "properties": {"age": 30}},
+            {"name": "TechCorp", "entity_type": "company", "properties": {"industry": "tech"}},
+            {"name": "Center", "entity_type": "test"},
+            {"name": "Connected1", "entity_type": "test"},
+            {"name": "Connected2", "entity_type": "test"},
+            {"name": "Unconnected", "entity_type": "test"},
+        ]
+    )
+    return service
 
 
 class TestMemoryService:
@@ -82,41 +104,34 @@ class TestMemoryService:
         assert relation["relation_type"] == "works_at"
         assert relation["properties"]["role"] == "manager"
 
-    def test_query_graph(self, memory_service_fixture):
-        # Set up a test graph
-        entities = [
-            {"name": "Alice", "entity_type": "person", "properties": {"age": 25}},
-            {"name": "Bob", "entity_type": "person", "properties": {"age": 30}},
-            {"name": "TechCorp", "entity_type": "company", "properties": {"industry": "tech"}},
-        ]
-        memory_service_fixture.create_entities(entities)
-        
+    def test_query_graph(self, populated_memory):
+        # Entities come pre-seeded from the class fixture
         relations = [
             {"source": "Alice", "target": "TechCorp", "relation_type": "works_at"},
             {"source": "Bob", "target": "TechCorp", "relation_type": "works_at"},
             {"source": "Alice", "target": "Bob", "relation_type": "knows"},
         ]
-        memory_service_fixture.create_relations(relations)
-        
+        populated_memory.create_relations(relations)
+
         # Query entities
-        people = memory_service_fixture.query_entities("person")
+        people = populated_memory.query_entities("person")
         assert len(people) == 2
-        
+
         # Query with property filter
-        young_people = memory_service_fixture.query_entities("person", {"age": 25})
+        young_people = populated_memory.query_entities("person", {"age": 25})
         assert len(young_people) == 1
         assert young_people[0]["name"] == "Alice"
-        
+
         # Query relations
-        work_relations = memory_service_fixture.query_relations("works_at")
+        work_relations = populated_memory.query_relations("works_at")
         assert len(work_relations) == 2
-        
+
         # Query outgoing relations
-        alice_relations = memory_service_fixture.query_relations(source="Alice")
+        alice_relations = populated_memory.query_relations(source="Alice")
         assert len(alice_relations) == 2
-        
+
         # Query specific relation
-        specific_relation = memory_service_fixture.query_relations("knows", "Alice", "Bob")
+        specific_relation = populated_memory.query_relations("knows", "Alice", "Bob")
         assert len(specific_relation) == 1
 
     def test_user_preferences(self, memory_service_fixture):
@@ -191,24 +206,16 @@ class TestMemoryService:
         assert remaining[0]["source"] == "NodeA"
         assert remaining[0]["target"] == "NodeC"
 
-    def test_entity_connections(self, memory_service_fixture):
-        # Create entities and relations for testing connections
-        entities = [
-            {"name": "Center", "entity_type": "test"},
-            {"name": "Connected1", "entity_type": "test"},
-            {"name": "Connected2", "entity_type": "test"},
-            {"name": "Unconnected", "entity_type": "test"},
-        ]
-        memory_service_fixture.create_entities(entities)
-        
+    def test_entity_connections(self, populated_memory):
+        # Entities come pre-seeded from the class fixture
         relations = [
             {"source": "Center", "target": "Connected1", "relation_type": "connects"},
             {"source": "Connected2", "target": "Center", "relation_type": "connects"},
         ]
-        memory_service_fixture.create_relations(relations)
-        
+        populated_memory.create_relations(relations)
+
         # Get connections
-        connections = memory_service_fixture.get_entity_connections("Center")
+        connections = populated_memory.get_entity_connections("Center")
         
         # Verify connections
         assert len(connections) == 2
@@ -218,20 +225,15 @@ class TestMemoryService:
         assert "Unconnected" not in connection_names
 
     @patch("networkx.DiGraph")
-    def test_graph_db_mode(self, mock_digraph):
+    def test_graph_db_mode(self, mock_digraph, tmp_path):
         # Test when using graph database mode
-        test_dir = Path("./test_graph_db")
-        test_dir.mkdir(exist_ok=True)
-        try:
-            memory_file = test_dir / "graph_db_test.json"
+        memory_file = tmp_path / "graph_db_test.json"
 
-            with patch("app.core.memory_service.get_config") as mock_config:
-                mock_config.return_value.use_graph_db = True
+        with patch("app.core.memory_service.get_config") as mock_config:
+            mock_config.return_value.use_graph_db = True
 
-                # This should initialize the networkx graph
-                MemoryService(str(memory_file))
+            # This should initialize the networkx graph
+            MemoryService(str(memory_file))
 
-                # Verify DiGraph was created
-                assert mock_digraph.called
-        finally:
-            shutil.rmtree(test_dir)
+            # Verify DiGraph was created
+            assert mock_digraph.called
@@ -1,65 +1,178 @@
 import pytest
-import os
-import shutil
-import json
-import asyncio
-from pathlib import Path
-from unittest.mock import patch, MagicMock, AsyncMock
+from types import SimpleNamespace
+from unittest.mock import patch
 
 from app.core.scraper_service import ScraperService
-from bs4 import BeautifulSoup
 
 
-@pytest.fixture
-def temp_dir():
-    # Create a temporary directory for testing
-    temp_dir = Path("./test_scraper_data")
-    temp_dir.mkdir(exist_ok=True)
-    yield temp_dir
-    # Cleanup
-    shutil.rmtree(temp_dir)
+# HTML/XML fixtures hoisted to module scope: built once at import time
+# (amortized per xdist worker) instead of re-bound in every test body
+_PAGE_HTML = """
+<html>
+    <head>
+        <title>Test Page</title>
+        <meta name="description" content="Test description">
+    </head>
+    <body>
+        <h1>Test Heading</h1>
+        <p>Test paragraph content.</p>
+    </body>
+</html>
+"""
+
+_METADATA_HTML = """
+<html>
+    <head>
+        <title>Metadata Test</title>
+        <meta name="description" content="Meta description">
+        <meta name="keywords" content="test, metadata, extraction">
+        <meta property="og:title" content="OG Title">
+        <meta property="og:description" content="OG Description">
+        <script type="application/ld+json">
+            {"@context": "https://schema.org", "@type": "Article", "name": "Test Article"}
+        </script>
+    </head>
+    <body>
+        <h1>Test Content</h1>
+    </body>
+</html>
+"""
+
+_PAGINATION_PAGE_1 = """
+<html>
+    <head><title>Page 1</title></head>
+    <body>
+        <h1>First Page</h1>
+        <p>Content on first page</p>
+        <a class="next" href="https://example.com/page/2" rel="next">Next Page</a>
+    </body>
+</html>
+"""
+
+_PAGINATION_PAGE_2 = """
+<html>
+    <head><title>Page 2</title></head>
+    <body>
+        <h1>Second Page</h1>
+        <p>Content on second page</p>
+    </body>
+</html>
+"""
+
+_SITEMAP_XML = """
+<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+    <url>
+        <loc>https://example.com/page1</loc>
+        <lastmod>2023-01-01</lastmod>
+    </url>
+    <url>
+        <loc>https://example.com/page2</loc>
+        <lastmod>2023-01-02</lastmod>
+    </url>
+</urlset>
+"""
+
+_SITEMAP_PAGE_HTML = """
+<html>
+    <head><title>Test Page</title></head>
+    <body><p>Test content</p></body>
+</html>
+"""
+
+
+def _make_fake_playwright(html="", title="", goto_exc=None):
+    """Build a hand-rolled Playwright stand-in: plain namespaces with
+    recording coroutines instead of a tower of AsyncMock constructions
+    (each of which auto-specs the full magic-method surface). Pages serve
+    `html`/`title`; `goto_exc` makes navigation raise."""
+    calls = {"goto": 0, "screenshot": 0}
+
+    async def _goto(*args, **kwargs):
+        calls["goto"] += 1
+        if goto_exc is not None:
+            raise goto_exc
+        return response
+
+    async def _screenshot(*args, **kwargs):
+        calls["screenshot"] += 1
+        return b"fake screenshot data"
+
+    async def _content():
+        return html
+
+    async def _title():
+        return title
+
+    async def _wait_for_load_state(*args, **kwargs):
+        return None
+
+    async def _new_page():
+        return page
+
+    async def _close():
+        return None
+
+    async def _new_context(*args, **kwargs):
+        return context
+
+    async def _launch(*args, **kwargs):
+        return browser
+
+    async def _start():
+        return playwright
+
+    response = SimpleNamespace(ok=True, status=200, status_text="OK", headers={})
+    page = SimpleNamespace(
+        goto=_goto,
+        screenshot=_screenshot,
+        content=_content,
+        title=_title,
+        wait_for_load_state=_wait_for_load_state,
+        close=_close,
+    )
+    context = SimpleNamespace(new_page=_new_page, close=_close)
+    browser = SimpleNamespace(new_context=_new_context)
+    playwright = SimpleNamespace(chromium=SimpleNamespace(launch=_launch))
+    handle = SimpleNamespace(start=_start)
+    return (lambda: handle), calls
 
 
 @pytest.fixture
-def scraper_service(temp_dir):
+def temp_dir(tmp_path):
+    # tmp_path is unique per test and per xdist worker, unlike the old
+    # shared ./test_scraper_data literal, and pytest handles cleanup
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def _scraper_config_patch():
+    # Enter the config patch once per session; per-test fixtures only
+    # retarget the data path on the shared mock
     with patch("app.core.scraper_service.get_config") as mock_config:
         mock_config.return_value.scraper_min_delay = 0.1
         mock_config.return_value.scraper_max_delay = 0.2
-        mock_config.return_value.scraper_data_path = str(temp_dir)
+        yield mock_config
 
-        service = ScraperService()
-        yield service
+
+@pytest.fixture
+def scraper_service(_scraper_config_patch, temp_dir):
+    # The service holds mutable browser/data-dir state, so it stays
+    # per-test even though the patch is session-scoped
+    _scraper_config_patch.return_value.scraper_data_path = str(temp_dir)
+    return ScraperService()
 
 
 class TestScraperService:
     @pytest.mark.asyncio
-    @patch("app.core.scraper_service.aiohttp.ClientSession")
-    async def test_scrape_url(self, mock_session, scraper_service):
-        # Mock the aiohttp session
-        mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
-
-        # Mock response
-        mock_response = AsyncMock()
-        mock_response.status = 200
-        mock_response.text = AsyncMock(
-            return_value="""
-        <html>
-            <head>
-                <title>Test Page</title>
-                <meta name="description" content="Test description">
-            </head>
-            <body>
-                <h1>Test Heading</h1>
-                <p>Test paragraph content.</p>
-            </body>
-        </html>
-        """
+    async def test_scrape_url(self, scraper_service):
+        # Drive the real Playwright pipeline (markdown conversion,
+        # metadata and link extraction) against a fake browser
+        fake_async_playwright, calls = _make_fake_playwright(
+            html=_PAGE_HTML, title="Test Page"
         )
-        mock_session_instance.get.return_value.__aenter__.return_value = mock_response
-
-        # Test scraping a URL
-        result = await scraper_service.scrape_url("https://example.com")
+        with patch("app.core.scraper_service.async_playwright", fake_async_playwright):
+            result = await scraper_service.scrape_url("https://example.com")
 
         # Verify successful scrape
         assert result["success"] is True
@@ -68,19 +181,16 @@ class TestScraperService:
         assert "Test Heading" in result["content"]
         assert "Test paragraph" in result["content"]
         assert result["metadata"]["description"] == "Test description"
+        assert calls["goto"] == 1
 
     @pytest.mark.asyncio
-    @patch("app.core.scraper_service.aiohttp.ClientSession")
-    async def test_scrape_url_error(self, mock_session, scraper_service):
-        # Mock a failed response
-        mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
-
-        # Connection error
-        mock_session_instance.get.side_effect = Exception("Connection error")
-
-        # Test scraping with error
-        result = await scraper_service.scrape_url("https://nonexistent.example.com")
+    async def test_scrape_url_error(self, scraper_service):
+        # Navigation failure surfaces as a failed-scrape result
+        fake_async_playwright, _ = _make_fake_playwright(
+            goto_exc=Exception("Connection error")
+        )
+        with patch("app.core.scraper_service.async_playwright", fake_async_playwright):
+            result = await scraper_service.scrape_url("https://nonexistent.example.com")
 
         # Verify failed scrape
         assert result["success"] is False
@@ -89,76 +199,35 @@ class TestScraperService:
 
     @pytest.mark.asyncio
     async def test_extract_metadata(self, scraper_service):
-        # Create sample HTML
-        html = """
-        <html>
-            <head>
-                <title>Metadata Test</title>
-                <meta name="description" content="Meta description">
-                <meta name="keywords" content="test, metadata, extraction">
-                <meta property="og:title" content="OG Title">
-                <meta property="og:description" content="OG Description">
-                <script type="application/ld+json">
-                    {"@context": "https://schema.org", "@type": "Article", "name": "Test Article"}
-                </script>
-            </head>
-            <body>
-                <h1>Test Content</h1>
-            </body>
-        </html>
-        """
-
-        # Extract metadata
-        soup = BeautifulSoup(html, "html.parser")
-        metadata = scraper_service._extract_metadata(html, "https://example.com/metadata")
-
-        # Verify metadata extraction
-        assert metadata["title"] == "Metadata Test"
-        assert metadata["description"] == "Meta description"
-        assert "og:title" in metadata
-        assert metadata["og:title"] == "OG Title"
-        assert len(metadata["structured_data"]) == 1
-        assert metadata["structured_data"][0]["@type"] == "Article"
+        # Extract metadata (_extract_metadata parses the HTML itself)
+        metadata = scraper_service._extract_metadata(
+            _METADATA_HTML, "https://example.com/metadata"
+        )
+
+        # Verify metadata extraction: Open Graph values take precedence
+        # over the title/description tags, stored under the bare key
+        assert metadata["title"] == "OG Title"
+        assert metadata["description"] == "OG Description"
+        assert metadata["source_url"] == "https://example.com/metadata"
+        items = metadata["structured_data"]["items"]
+        assert len(items) == 1
+        assert items[0]["@type"] == "Article"
 
     @pytest.mark.asyncio
-    @patch("app.core.scraper_service.aiohttp.ClientSession")
-    async def test_scrape_with_pagination(self, mock_session, scraper_service):
-        # Mock session
-        mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
-
-        # First page with next link
-        first_page = """
-        <html>
-            <head><title>Page 1</title></head>
-            <body>
-                <h1>First Page</h1>
-                <p>Content on first page</p>
-                <a href="https://example.com/page/2" rel="next">Next Page</a>
-            </body>
-        </html>
-        """
-
-        # Second page with no next link
-        second_page = """
-        <html>
-            <head><title>Page 2</title></head>
-            <body>
-                <h1>Second Page</h1>
-                <p>Content on second page</p>
-            </body>
-        </html>
-        """
-
-        # Set up mock responses for pagination
-        mock_responses = [
-            # First page response
-            AsyncMock(status=200, text=AsyncMock(return_value=first_page)),
-            # Second page response
-            AsyncMock(status=200, text=AsyncMock(return_value=second_page)),
-        ]
-
-        mock_session_instance.get.return_value.__aenter__.side_effect = mock_responses
+    async def test_scrape_with_pagination(self, scraper_service, monkeypatch):
+        # Canned per-page scrape results; the service finds the a.next
+        # link in page 1's content and follows it, page 2 has none
+        pages = {
+            "https://example.com": _PAGINATION_PAGE_1,
+            "https://example.com/page/2": _PAGINATION_PAGE_2,
+        }
+        scraped = []
+
+        async def fake_scrape_url(url):
+            scraped.append(url)
+            return {"url": url, "title": "Page", "content": pages[url], "success": True}
+
+        monkeypatch.setattr(scraper_service, "scrape_url", fake_scrape_url)
 
         # Test paginated scraping
         result = await scraper_service.scrape_with_pagination("https://example.com")
@@ -168,83 +237,46 @@ class TestScraperService:
         assert result["pages_scraped"] == 2
         assert "First Page" in result["content"]
         assert "Second Page" in result["content"]
+        assert scraped == ["https://example.com", "https://example.com/page/2"]
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    @patch("playwright.async_api.async_playwright")
-    async def test_capture_screenshot(self, mock_playwright, scraper_service, temp_dir):
-        # Mock Playwright
-        mock_playwright_instance = AsyncMock()
-        mock_playwright.return_value.__aenter__.return_value = mock_playwright_instance
-
-        # Mock browser, context, and page
-        mock_browser = AsyncMock()
-        mock_context = AsyncMock()
-        mock_page = AsyncMock()
-
-        mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
-        mock_browser.new_context = AsyncMock(return_value=mock_context)
-        mock_context.new_page = AsyncMock(return_value=mock_page)
-
-        # Mock screenshot
-        mock_page.screenshot = AsyncMock(return_value=b"fake screenshot data")
-
-        # Test capturing screenshot
-        result = await scraper_service.capture_screenshot("https://example.com")
+    async def test_capture_screenshot(self, scraper_service, temp_dir):
+        # Use the module-level fake instead of five AsyncMocks, patching
+        # the name the service actually resolves at call time
+        fake_async_playwright, calls = _make_fake_playwright()
+        with patch("app.core.scraper_service.async_playwright", fake_async_playwright):
+            # Test capturing screenshot
+            result = await scraper_service.capture_screenshot("https://example.com")
 
         # Verify screenshot capture
         assert result["success"] is True
         assert "screenshot_path" in result
-        assert mock_page.goto.called
-        assert mock_page.screenshot.called
+        assert calls["goto"] == 1
+        assert calls["screenshot"] == 1
 
+    @pytest.mark.slow
     @pytest.mark.asyncio
-    @patch("app.core.scraper_service.aiohttp.ClientSession")
-    async def test_scrape_sitemap(self, mock_session, scraper_service):
-        # Mock session
-        mock_session_instance = AsyncMock()
-        mock_session.return_value.__aenter__.return_value = mock_session_instance
-
-        # Mock sitemap response
-        sitemap_xml = """
-        <?xml version="1.0" encoding="UTF-8"?>
-        <urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
-            <url>
-                <loc>https://example.com/page1</loc>
-                <lastmod>2023-01-01</lastmod>
-            </url>
-            <url>
-                <loc>https://example.com/page2</loc>
-                <lastmod>2023-01-02</lastmod>
-            </url>
-        </urlset>
-        """
-
-        # Mock page responses
-        page_html = """
-        <html>
-            <head><title>Test Page</title></head>
-            <body><p>Test content</p></body>
-        </html>
-        """
-
-        # Set up mock responses
-        sitemap_response = AsyncMock(status=200, text=AsyncMock(return_value=sitemap_xml))
-        page_response = AsyncMock(status=200, text=AsyncMock(return_value=page_html))
-
-        # Return different responses for different URLs
-        def get_side_effect(url, **kwargs):
+    async def test_scrape_sitemap(self, scraper_service, monkeypatch):
+        # Serve the sitemap XML for the .xml URL and page HTML otherwise
+        async def fake_scrape_url(url):
             if url.endswith(".xml"):
-                return sitemap_response
-            else:
-                return page_response
+                return {"url": url, "title": "Sitemap", "content": _SITEMAP_XML, "success": True}
+            return {
+                "url": url,
+                "title": "Test Page",
+                "content": _SITEMAP_PAGE_HTML,
+                "success": True,
+            }
 
-        mock_session_instance.get.side_effect = get_side_effect
+        monkeypatch.setattr(scraper_service, "scrape_url", fake_scrape_url)
 
         # Test sitemap scraping
         result = await scraper_service.scrape_sitemap("https://example.com/sitemap.xml", max_urls=2)
 
         # Verify results
         assert result["success"] is True
-        assert len(result["results"]) == 2
-        assert result["results"][0]["url"] == "https://example.com/page1"
-        assert result["results"][1]["url"] == "https://example.com/page2"
+        assert result["urls_found"] == 2
+        assert len(result["urls_scraped"]) == 2
+        assert result["urls_scraped"][0]["url"] == "https://example.com/page1"
+        assert result["urls_scraped"][1]["url"] == "https://example.com/page2"